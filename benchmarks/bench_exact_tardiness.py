@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scheduling_core import make_job_table, objective_weights, tardiness_branch_and_bound
+
+#Regression check for tardiness_branch_and_bound: on small instances the cost must equal a subset dynamic program and
+#on 40 jobs every instance must be proven or stop within max_gap of its bound, and the bound of a search stopped
+#early must not exceed the bound (or optimum) of the full one. Instances follow Potts and Van Wassenhove: p U[1, 100], w U[1, 10] and due dates
+#U[P(1 - TF - RDD/2), P(1 - TF + RDD/2)] for tardiness factor TF and due date range RDD.
+#Run with: python benchmarks/bench_exact_tardiness.py
+
+OBJECTIVES = ["Total tardiness", "Total weighted tardiness (WjTj)"]
+
+def tardiness_instance(jobs, tardiness_factor, due_range, seed):
+    rng = np.random.default_rng([seed, jobs, int(tardiness_factor * 10), int(due_range * 10)])
+    process_time = rng.integers(1, 101, jobs)
+    total = process_time.sum()
+    due_date = rng.integers(int(total * max(0, 1 - tardiness_factor - due_range / 2)), int(total * (1 - tardiness_factor + due_range / 2)) + 1, jobs)
+    return make_job_table(np.arange(1, jobs + 1), process_time, due_date, rng.integers(1, 11, jobs), np.zeros(jobs, dtype=np.int64))
+
+def subset_optimum(table, objective):
+    #f(S) = min over j in S of f_j max(0, p(S) - d_j) + f(S - j), over all 2^n subsets.
+    weights = objective_weights(objective)
+    count = len(table.job_numbers)
+    times = table.process_time.tolist()
+    due = table.due_date.tolist()
+    factor = (weights[2] + weights[6] * table.weight).tolist()
+    best = [0.0] * (1 << count)
+    length = [0] * (1 << count)
+    for members in range(1, 1 << count):
+        low = members & -members
+        length[members] = length[members ^ low] + times[low.bit_length() - 1]
+        best[members] = min(factor[row] * max(0, length[members] - due[row]) + best[members & ~(1 << row)] for row in range(count) if members >> row & 1)
+    return best[-1]
+
+def check_small(max_jobs=14, seeds=12):
+    for objective in OBJECTIVES:
+        for seed in range(seeds):
+            for tardiness_factor, due_range in ((0.2, 0.6), (0.6, 0.2), (0.8, 0.6), (1.0, 0.2)):
+                table = tardiness_instance(max_jobs - seed % 8, tardiness_factor, due_range, seed)
+                optimum = subset_optimum(table, objective)
+                _, cost, _, proven = tardiness_branch_and_bound(table, objective)
+                if not proven or cost != optimum:
+                    raise AssertionError(f"{objective}, seed {seed}: cost {cost} against the optimum {optimum}.")
+    print("small instances match the subset dynamic program")
+
+def main(jobs=40, seeds=3, time_limit=60.0, max_gap=0.1):
+    print(f"{'objective':>32} {'TF':>4} {'RDD':>4} {'seed':>4} {'cost':>9} {'bound':>9} {'gap':>7} {'time (s)':>9}")
+    failures = []
+    for objective in OBJECTIVES:
+        for tardiness_factor in (0.2, 0.4, 0.6, 0.8):
+            for due_range in (0.2, 0.6, 1.0):
+                for seed in range(seeds):
+                    table = tardiness_instance(jobs, tardiness_factor, due_range, seed)
+                    start = time.perf_counter()
+                    _, cost, lower_bound, proven = tardiness_branch_and_bound(table, objective, time_limit=time_limit)
+                    elapsed = time.perf_counter() - start
+                    gap = 0.0 if proven else (cost - lower_bound) / max(cost, 1)
+                    print(f"{objective:>32} {tardiness_factor:>4} {due_range:>4} {seed:>4} {cost:>9g} {lower_bound:>9g} {gap:>7.2%} {elapsed:>9.2f}")
+                    if gap > max_gap:
+                        failures.append(f"{objective}, TF {tardiness_factor}, RDD {due_range}, seed {seed}: gap {gap:.2%}")
+                    #time_limit=0 stops at the first clock check, after 1024 nodes.
+                    _, _, stopped_bound, _ = tardiness_branch_and_bound(table, objective, time_limit=0)
+                    if stopped_bound > lower_bound + 1e-9 * max(1, lower_bound):
+                        failures.append(f"{objective}, TF {tardiness_factor}, RDD {due_range}, seed {seed}: bound {stopped_bound} above {lower_bound}")
+    if failures:
+        raise AssertionError("Failed on:\n" + "\n".join(failures))
+
+if __name__ == "__main__":
+    check_small()
+    main()
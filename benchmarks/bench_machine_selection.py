@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scheduling_core import MachinePool, machine_pool, machine_schedule, make_job_table, with_machine_speeds
+
+#Compares the heap used by machine_schedule with the old machine_times.index(min(machine_times)) scan, and on uniform
+#machines the segment tree of MachinePool with its scan over the machine classes.
+#Run with: python benchmarks/bench_machine_selection.py
+
+def linear_scan_completion(times, machines):
+    machine_times = [0] * machines
+    completion = []
+    for time_ in times.tolist():
+        machine_index = machine_times.index(min(machine_times))
+        machine_times[machine_index] += time_
+        completion.append(machine_times[machine_index])
+    return np.array(completion)
+
+def best_of(function, repeats=3):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main(jobs=20000, machine_counts=(2, 8, 32, 128, 256, 512, 1024)):
+    rng = np.random.default_rng(0)
+    process_time = rng.integers(1, 100, jobs)
+    rows = np.arange(jobs)
+    print(f"{'machines':>8} {'scan (ms)':>10} {'heap (ms)':>10} {'speedup':>8}")
+    for machines in machine_counts:
+        scan_time, scan_result = best_of(lambda: linear_scan_completion(process_time, machines))
+        heap_time, heap_result = best_of(lambda: machine_schedule(process_time, rows, machines, "SPT")[2])
+        if not np.array_equal(scan_result, heap_result):
+            raise AssertionError(f"Heap schedule differs from the linear scan for {machines} machines.")
+        print(f"{machines:>8} {scan_time * 1000:>10.1f} {heap_time * 1000:>10.1f} {scan_time / heap_time:>7.1f}x")
+
+def main_uniform(jobs=20000, machine_counts=(32, 128, 256, 512, 1024)):
+    #Speeds spread from 1 to 2, so every machine is a class of its own.
+    rng = np.random.default_rng(0)
+    table = make_job_table(np.arange(jobs), rng.integers(1, 100, jobs), np.zeros(jobs, dtype=np.int64), np.ones(jobs, dtype=np.int64),
+                           np.zeros(jobs, dtype=np.int64))
+    rows = np.arange(jobs)
+    print(f"{'uniform':>8} {'scan (ms)':>10} {'tree (ms)':>10} {'speedup':>8}")
+    for machines in machine_counts:
+        uniform = with_machine_speeds(table, np.linspace(1, 2, machines))
+        pool = machine_pool(uniform, machines)
+        scan = MachinePool(pool.machine_times, pool.eligible, tree_classes=machines + 1)
+        tree = MachinePool(pool.machine_times, pool.eligible, tree_classes=1)
+        scan_time, scan_result = best_of(lambda: machine_schedule(uniform.process_time, rows, machines, "SPT", pool=scan))
+        tree_time, tree_result = best_of(lambda: machine_schedule(uniform.process_time, rows, machines, "SPT", pool=tree))
+        if not all(np.array_equal(a, b) for a, b in zip(scan_result, tree_result)):
+            raise AssertionError(f"Tree schedule differs from the class scan for {machines} machines.")
+        print(f"{machines:>8} {scan_time * 1000:>10.1f} {tree_time * 1000:>10.1f} {scan_time / tree_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
+    main_uniform()
@@ -0,0 +1,210 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scheduling_core import (POPULATION_METHODS, SolverSession, build_job_table, calculate_completion_times, calculate_flowshop_completion_times,
+                          calculate_objectives, calculate_objectives_flowshop, dispatching_rows, flowshop_cumulative_times, flowshop_makespans,
+                          local_search, local_search_flowshop, make_job_table, neh_rows, population_search, rows_to_sequence,
+                          schedule_objectives, with_machine_speeds)
+from instances import TAILLARD_INSTANCES, generate_instance, load_taillard, taillard_instance
+
+#Times the evaluators, the objective functions and both local searches on generated instances and on Taillard's
+#flowshop instances, and compares seconds and solution quality with benchmarks/baselines.json.
+#Every search gets an explicit generator seeded with --seed, so the qualities are the same from run to run.
+#Run with: python benchmarks/bench_suite.py [--suite quick|default|full] [--update] [--taillard FILE]
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#(problem, jobs, machines, local search iterations; 0 skips the search on sizes where it would dominate the run)
+SUITES = {
+    "quick": [("Single", 10, 1, 500), ("Parallel", 1000, 10, 500), ("Flowshop", 100, 5, 500)],
+}
+SUITES["default"] = SUITES["quick"] + [("Single", 1000, 1, 2000), ("Parallel", 10000, 50, 500), ("Flowshop", 1000, 20, 200),
+                                       ("Parallel", 1000, 256, 100), ("Parallel", 100000, 500, 0)]
+SUITES["full"] = SUITES["default"] + [("Single", 100000, 1, 0), ("Parallel", 100000, 10, 100), ("Flowshop", 10000, 50, 0)]
+
+def best_of(function, repeats=3):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def format_quality(quality):
+    #Objectives on uniform machines are fractions; four decimals are enough to compare them.
+    if quality is None:
+        return ''
+    return str(round(quality, 4)) if isinstance(quality, float) else str(quality)
+
+def bench_generated(problem, jobs, machines, iterations, seed):
+    #One row per timed function: (name, seconds, units handled, unit, quality or None).
+    table = build_job_table(generate_instance(problem, jobs, machines, seed).set_index('Job Number', drop=False))
+    sequence = rows_to_sequence(table, dispatching_rows(table, "SPT"))
+    rows = []
+    if problem == "Flowshop":
+        seconds, completion = best_of(lambda: calculate_flowshop_completion_times(table, machines, sequence))
+        rows.append(("calculate_flowshop_completion_times", seconds, jobs * machines, "operations", None))
+        seconds, objectives = best_of(lambda: calculate_objectives_flowshop(table, sequence, completion))
+    else:
+        seconds, completion = best_of(lambda: calculate_completion_times(machines, table, sequence, "SPT"))
+        rows.append(("calculate_completion_times", seconds, jobs, "jobs", None))
+        seconds, objectives = best_of(lambda: calculate_objectives(table, sequence, completion))
+    rows.append(("objectives", seconds, jobs, "jobs", objectives["Total weighted tardiness (WjTj)"]))
+    if problem == "Parallel" and jobs * machines <= 10 ** 7:
+        #Uniform machines, speeds spread from 1 to 2, decoded by earliest completion time. Their (jobs x machines)
+        #times are held as Python lists while decoding, which the largest instances would not fit in memory.
+        uniform = with_machine_speeds(table, np.linspace(1, 2, machines))
+        seconds, _ = best_of(lambda: calculate_completion_times(machines, uniform, sequence, "SPT"))
+        rows.append(("calculate_completion_times/uniform", seconds, jobs, "jobs", None))
+    if iterations:
+        start = time.perf_counter()
+        if problem == "Flowshop":
+            result = local_search_flowshop(table, "SPT", machines, 0, sequence, "Meta-Heuristic", iterations=iterations, initial_threshold=10,
+                                           rng=seed)
+        else:
+            result = local_search(table, "SPT", machines, 0, sequence, "Meta-Heuristic", iterations=iterations, initial_threshold=10, rng=seed)
+        seconds = time.perf_counter() - start
+        rows.append(("local_search_flowshop" if problem == "Flowshop" else "local_search", seconds, result[3], "evaluations", result[1]))
+        #First-improvement insertion descent on the same budget; it may stop early at a local optimum.
+        start = time.perf_counter()
+        search = local_search_flowshop if problem == "Flowshop" else local_search
+        result = search(table, "SPT", machines, 0, sequence, "Local Search", iterations=iterations, neighborhood="Insertion",
+                        strategy="First Improvement", rng=seed)
+        rows.append((search.__name__ + "/insertion-first", time.perf_counter() - start, result[3], "evaluations", result[1]))
+        if problem == "Parallel" and jobs <= 1000:
+            #Every evaluation replays the schedule after the first changed position, so the large instances are left out.
+            start = time.perf_counter()
+            result = local_search(uniform, "SPT", machines, 0, sequence, "Meta-Heuristic", iterations=iterations, initial_threshold=10,
+                                  rng=seed)
+            rows.append(("local_search/uniform", time.perf_counter() - start, result[3], "evaluations", result[1]))
+    if iterations and (jobs <= 100 or problem == "Flowshop" and jobs <= 1000):
+        #Population methods on a twentieth of the budget in generations (destruction rounds for iterated greedy).
+        #Without Taillard's acceleration an insertion costs O(n^2), so long parallel sequences are left out.
+        for method in POPULATION_METHODS:
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                sequence_found, schedule, _ = population_search(table, machines, method, problem, iterations=max(1, iterations // 20),
+                                                                population_size=20, rng=seed)
+            seconds = time.perf_counter() - start
+            objectives = schedule_objectives(table, schedule)
+            rows.append((method.lower().replace(" ", "_"), seconds, len(sequence_found), "jobs", objectives["Makespan"]))
+    if iterations and jobs <= 1000:
+        #A re-plan: one job arrives at an already solved schedule, is inserted at its best position and the session
+        #runs a short descent from there.
+        session = SolverSession(table, problem, machines, sequence=sequence, rng=seed)
+        session.reoptimize(iterations, time_limit=None)
+        start = time.perf_counter()
+        stage_times = table.stage_times[0].tolist() if table.stage_times.shape[1] else None
+        session.add_job(jobs + 1, table.process_time[0].item(), table.due_date[0].item(), machine_times=stage_times)
+        evaluations = session.reoptimize(iterations // 5, time_limit=None)
+        rows.append(("solver_session/add_job", time.perf_counter() - start, evaluations, "evaluations", session.cost))
+    return rows
+
+#Run in a fresh interpreter: the seconds the solver core's import takes and how many of the lazily imported libraries it loaded.
+IMPORT_SNIPPET = ("import sys, time; start = time.perf_counter(); import scheduling_core; seconds = time.perf_counter() - start; "
+                  "print(seconds, sum(name in sys.modules for name in ('pandas', 'matplotlib', 'tkinter')))")
+#A whole short-lived solver process: start, import, anneal a 10-job instance and exit.
+SOLVE_SNIPPET = """
+import contextlib, io
+import numpy as np
+from scheduling_core import make_job_table, solve_problem
+table = make_job_table(np.arange(1, 11), np.arange(1, 11), np.full(10, 20), np.ones(10, dtype=np.int64), np.zeros(10, dtype=np.int64))
+with contextlib.redirect_stdout(io.StringIO()):
+    solve_problem(table, "Parallel", 2, "SPT", "Meta-Heuristic", threshold=10, objective="Total tardiness", rng=0)
+"""
+
+def bench_startup(repeats=5):
+    #Startup cost of the solver, the best of repeats fresh processes. The import's quality is the number of pandas,
+    #matplotlib and tkinter it pulled in, which should stay 0.
+    def run(snippet):
+        return subprocess.run([sys.executable, "-c", snippet], cwd=REPOSITORY, capture_output=True, text=True, check=True).stdout
+    imports = [run(IMPORT_SNIPPET).split() for _ in range(repeats)]
+    seconds, _ = best_of(lambda: run(SOLVE_SNIPPET), repeats)
+    return [("import", min(float(measured) for measured, _ in imports), 1, "imports", max(int(loaded) for _, loaded in imports)),
+            ("solve_10_jobs_process", seconds, 1, "processes", None)]
+
+def bench_taillard(instance, iterations, seed):
+    #NEH, then annealing from it; quality is the makespan relative to the best known one.
+    stage_times = instance["process_times"]
+    jobs, machines = stage_times.shape
+    cumulative_times = flowshop_cumulative_times(stage_times)
+    seconds, rows = best_of(lambda: neh_rows(stage_times, cumulative_times, flowshop_cumulative_times(stage_times[:, ::-1])))
+    makespan = flowshop_makespans(cumulative_times, rows)[0].item()
+    measured = [("neh", seconds, jobs * machines, "operations", round(makespan / instance["upper_bound"], 4))]
+    table = make_job_table(np.arange(1, jobs + 1), stage_times.sum(axis=1), np.zeros(jobs, dtype=np.int64), np.ones(jobs, dtype=np.int64),
+                           np.zeros(jobs, dtype=np.int64), stage_times)
+    start = time.perf_counter()
+    result = local_search_flowshop(table, "NEH", machines, 0, rows_to_sequence(table, rows), "Meta-Heuristic", iterations=iterations,
+                                   initial_threshold=10, rng=seed)
+    measured.append(("local_search_flowshop", time.perf_counter() - start, result[3], "evaluations", round(result[1] / instance["upper_bound"], 4)))
+    return measured
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling evaluators and searches.")
+    parser.add_argument("--suite", choices=sorted(SUITES), default="default")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--taillard", default=None, help="OR-Library file of Taillard instances (default: the built-in ta001-ta010).")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Flag a case slower than this multiple of its baseline.")
+    parser.add_argument("--import-budget", type=float, default=0.5, help="Flag an import of the solver that takes longer than this many seconds.")
+    parser.add_argument("--update", action="store_true", help="Store this run as the new baselines.")
+    parser.add_argument("--write-instances", default=None, help="Also write the generated instances as CSV files to this directory.")
+    arguments = parser.parse_args(argv)
+
+    cases = [("startup", bench_startup)]
+    for problem, jobs, machines, iterations in SUITES[arguments.suite]:
+        name = f"{problem}-{jobs}x{machines}"
+        if arguments.write_instances:
+            os.makedirs(arguments.write_instances, exist_ok=True)
+            generate_instance(problem, jobs, machines, arguments.seed).to_csv(os.path.join(arguments.write_instances, name + ".csv"), index=False)
+        cases.append((name, lambda problem=problem, jobs=jobs, machines=machines, iterations=iterations:
+                      bench_generated(problem, jobs, machines, iterations, arguments.seed)))
+    taillard = load_taillard(arguments.taillard) if arguments.taillard else [taillard_instance(name) for name in TAILLARD_INSTANCES]
+    for instance in taillard:
+        cases.append((os.path.basename(instance["name"]), lambda instance=instance: bench_taillard(instance, 2000, arguments.seed)))
+
+    baselines = {}
+    if os.path.exists(BASELINES):
+        with open(BASELINES) as file:
+            baselines = json.load(file)
+    measured = {}
+    regressions = 0
+    print(f"{'case':<28}{'function':<38}{'seconds':>10}{'throughput':>24}{'quality':>14}{'baseline':>10}  status")
+    for name, run in cases:
+        for function, seconds, units, unit, quality in run():
+            key = f"{name}/{function}"
+            measured[key] = {"seconds": seconds, "quality": quality}
+            baseline = baselines.get(key)
+            status = "new"
+            if baseline is not None:
+                status = "ok"
+                if seconds > baseline["seconds"] * arguments.tolerance:
+                    status = "SLOWER"
+                if quality is not None and baseline["quality"] is not None and quality > baseline["quality"]:
+                    status = "WORSE" if status == "ok" else status + ",WORSE"
+            if function == "import" and seconds > arguments.import_budget:
+                status = "OVER BUDGET" if status in ("ok", "new") else status + ",OVER BUDGET"
+            regressions += status not in ("ok", "new")
+            throughput = f"{units / seconds:,.0f} {unit}/s" if seconds else "-"
+            print(f"{name:<28}{function:<38}{seconds:>10.4f}{throughput:>24}{format_quality(quality):>14}"
+                  f"{'' if baseline is None else format(baseline['seconds'], '.4f'):>10}  {status}")
+
+    if arguments.update:
+        baselines.update(measured)
+        with open(BASELINES, "w") as file:
+            json.dump(baselines, file, indent=1, sort_keys=True)
+        print(f"Baselines written to {BASELINES}")
+        return 0
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+#Reproducible benchmark instances: a seeded generator for the three problem types and Taillard's flowshop instances,
+#either regenerated from their published seeds or read from the OR-Library text files.
+
+PROBLEMS = ["Single", "Parallel", "Flowshop"]
+
+def generate_instance(problem, jobs, machines=1, seed=0):
+    #Process times U[1, 99], weights U[1, 10]; release dates spread over half of the expected schedule length and
+    #due dates a random slack after the earliest possible finish, so every objective has something to trade off.
+    if problem not in PROBLEMS:
+        raise ValueError(f"Unknown problem: {problem}")
+    machines = 1 if problem == "Single" else machines
+    #Flowshop instances get a time per machine, as 'process time 1' ... 'process time m' columns.
+    rng = np.random.default_rng([seed, jobs, machines, PROBLEMS.index(problem)])
+    if problem == "Flowshop":
+        stage_times = rng.integers(1, 100, (jobs, machines))
+        horizon = stage_times.sum(axis=0).max() + stage_times.mean(axis=0).sum()
+        earliest_finish = stage_times.sum(axis=1)
+    else:
+        process_time = rng.integers(1, 100, jobs)
+        horizon = process_time.sum() / machines
+        earliest_finish = process_time
+    release_date = rng.integers(0, max(1, int(horizon * 0.5)), jobs)
+    due_date = release_date + earliest_finish + rng.integers(0, max(1, int(horizon * 0.5)), jobs)
+    instance = pd.DataFrame({'Job Number': np.arange(1, jobs + 1), 'due date': due_date, 'weight': rng.integers(1, 11, jobs),
+                             'release date': release_date})
+    if problem == "Flowshop":
+        for machine in range(machines):
+            instance[f'process time {machine + 1}'] = stage_times[:, machine]
+    else:
+        instance.insert(1, 'process time', process_time)
+    return instance
+
+#Taillard (1993) instances by name: (jobs, machines, time seed, best known makespan).
+TAILLARD_INSTANCES = {
+    "ta001": (20, 5, 873654221, 1278), "ta002": (20, 5, 379008056, 1359), "ta003": (20, 5, 1866992158, 1081),
+    "ta004": (20, 5, 216771124, 1293), "ta005": (20, 5, 495070989, 1235), "ta006": (20, 5, 402959317, 1195),
+    "ta007": (20, 5, 1369363414, 1234), "ta008": (20, 5, 2021925980, 1206), "ta009": (20, 5, 573109518, 1230),
+    "ta010": (20, 5, 88325120, 1108),
+}
+
+def taillard_times(jobs, machines, seed):
+    #Taillard's portable generator (a Lehmer LCG, a = 16807, m = 2^31 - 1) filled machine by machine.
+    #Returns the (jobs x machines) processing time matrix.
+    times = np.empty((machines, jobs), dtype=np.int64)
+    for machine in range(machines):
+        for job in range(jobs):
+            k = seed // 127773
+            seed = 16807 * (seed % 127773) - k * 2836
+            if seed < 0:
+                seed += 2147483647
+            times[machine, job] = 1 + int(seed / 2147483647 * 99)
+    return times.T
+
+def taillard_instance(name):
+    jobs, machines, seed, upper_bound = TAILLARD_INSTANCES[name]
+    return {"name": name, "jobs": jobs, "machines": machines, "seed": seed, "upper_bound": upper_bound,
+            "process_times": taillard_times(jobs, machines, seed)}
+
+def load_taillard(path):
+    #Reads an OR-Library file of Taillard instances ("number of jobs, number of machines, initial seed, upper bound
+    #and lower bound :" followed by "processing times :" and one row per machine). A file may hold several instances.
+    with open(path) as file:
+        text = file.read()
+    instances = []
+    blocks = re.split(r"number of jobs[^\n]*\n", text)[1:]
+    for k, block in enumerate(blocks):
+        header, _, body = block.partition("processing times")
+        jobs, machines, seed, upper_bound, lower_bound = (int(value) for value in header.split()[:5])
+        values = [int(value) for value in body.partition(":")[2].split()[:jobs * machines]]
+        if len(values) != jobs * machines:
+            raise ValueError(f"Instance {k + 1} in {path} has {len(values)} processing times, expected {jobs * machines}.")
+        instances.append({"name": f"{path}#{k + 1}", "jobs": jobs, "machines": machines, "seed": seed, "upper_bound": upper_bound,
+                          "lower_bound": lower_bound, "process_times": np.array(values, dtype=np.int64).reshape(machines, jobs).T})
+    return instances
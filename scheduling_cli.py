@@ -0,0 +1,182 @@
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import json
+import os
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from scheduling_core import (COOLING_SCHEDULES, NEIGHBORHOODS, OBJECTIVES, POPULATION_METHODS, STRATEGIES, SearchStats, solve_problem, timed,
+                             with_machine_speeds)
+from scheduling_io import load_job_table
+from scheduling_plots import plot_convergence, schedule_gantt_chart
+
+#Headless batch runner: solves every instance file with the same settings as the GUI and writes
+#objectives.csv (one row per instance) and sequences.jsonl (one JSON object per instance) to the output directory.
+#Example: python scheduling_cli.py instances/ --problem Parallel --machines 4 --rule SPT --method Meta-Heuristic --threshold 20
+
+INSTANCE_EXTENSIONS = ('.xlsx', '.xls', '.csv', '.parquet')
+
+def find_instances(patterns):
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+        else:
+            matches = glob.glob(pattern, recursive=True)
+        paths.extend(path for path in matches if path.lower().endswith(INSTANCE_EXTENSIONS) and os.path.isfile(path))
+    return sorted(set(paths))
+
+def solve_instance(task):
+    path, settings = task
+    started = time.perf_counter()
+    record = {"instance": path}
+    stem = os.path.join(settings['output'], os.path.splitext(os.path.basename(path))[0])
+    stats = SearchStats(profile=settings['profile']) if settings['stats'] or settings['profile'] else None
+    try:
+        with stats.running() if stats is not None else contextlib.nullcontext():
+            table = load_job_table(path)
+            if settings['speeds']:
+                table = with_machine_speeds(table, settings['speeds'])
+            machines = settings['machines'] or (table.stage_times.shape[1] if settings['problem'] != "Single" else 0) or 1
+            #Every instance gets its own repeatable stream, whichever worker it lands on.
+            rng = np.random.default_rng([settings['seed'], zlib.crc32(os.path.basename(path).encode())])
+            #find_best_solution reports its neighbourhood count on stdout; keep batch output clean.
+            with contextlib.redirect_stdout(io.StringIO()):
+                results, best_sequence, label, schedule = solve_problem(table, settings['problem'], machines, settings['rule'], settings['method'],
+                                                          threshold=settings['threshold'], objective=settings['objective'],
+                                                          iterations=settings['iterations'] or None, cache_size=settings['cache_size'], stats=stats,
+                                                          neighborhood=settings['neighborhood'], strategy=settings['strategy'],
+                                                          cooling=COOLING_SCHEDULES[settings['cooling']](),
+                                                          stagnation_limit=settings['stagnation_limit'] or None,
+                                                          time_limit=settings['time_limit'], population_size=settings['population_size'],
+                                                          restarts=settings['restarts'], search_workers=settings['search_workers'], rng=rng)
+            record["objectives"] = {name: results[name] for name in OBJECTIVES}
+            record["sequences"] = {name: value for name, value in results.items() if name not in OBJECTIVES}
+            record["sequence"] = best_sequence
+            if settings['gantt']:
+                #Charts are rendered off-screen on the Agg canvas, one file per instance.
+                chart_path = f"{stem}.gantt.{settings['gantt']}"
+                with timed(stats, "rendering"):
+                    schedule_gantt_chart(table, schedule, machines, settings['problem'], label, output_path=chart_path)
+                record["gantt"] = chart_path
+    except Exception as e:
+        record["error"] = str(e)
+    if stats is not None:
+        record["stats"] = stats.summary()
+        if settings['stats']:
+            stats.to_json(f"{stem}.stats.json")
+            if stats.traces:
+                plot_convergence(stats, f"{stem}.convergence.png")
+        if settings['profile']:
+            with open(f"{stem}.profile.txt", "w") as profile_file:
+                profile_file.write(stats.profile_report())
+    record["seconds"] = time.perf_counter() - started
+    return record
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Solve machine scheduling instances without the GUI.")
+    parser.add_argument("instances", nargs="+", help="Instance files, directories or glob patterns.")
+    parser.add_argument("--problem", choices=["Single", "Parallel", "Flowshop"], default="Single")
+    parser.add_argument("--machines", type=int, default=None, help="Number of machines (default: 1, or the instance's own for Flowshop files with per-machine times).")
+    parser.add_argument("--speeds", default=None,
+                        help="Comma-separated machine speeds for Parallel (uniform machines); a job takes its time divided by the speed.")
+    parser.add_argument("--rule", default="SPT", help="Dispatching rule used when --method is None.")
+    parser.add_argument("--method", choices=["None", "Local Search", "Meta-Heuristic", "NEH Insertion", "Exact"] + POPULATION_METHODS, default="None")
+    parser.add_argument("--threshold", type=int, default=0, help="Initial temperature of the Meta-Heuristic.")
+    parser.add_argument("--objective", choices=OBJECTIVES, default="Makespan")
+    parser.add_argument("--iterations", type=int, default=500,
+                        help="Evaluations per start (generations for the population methods); 0 runs until the time or stagnation limit.")
+    parser.add_argument("--population-size", type=int, default=50, help="Individuals per generation of the Genetic Algorithm.")
+    parser.add_argument("--time-limit", type=float, default=None,
+                        help="Seconds per search; Exact then returns its best sequence and a lower bound.")
+    parser.add_argument("--stagnation-limit", type=int, default=5000,
+                        help="Stop Local Search and Meta-Heuristic after this many evaluations without a new best (0: off).")
+    parser.add_argument("--cooling", choices=list(COOLING_SCHEDULES), default="Geometric", help="Temperature schedule of the Meta-Heuristic.")
+    parser.add_argument("--neighborhood", choices=list(NEIGHBORHOODS), default="Swap", help="Move used by Local Search and Meta-Heuristic.")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="Random",
+                        help="How Local Search explores the neighborhood; the improvement scans stop at a local optimum.")
+    parser.add_argument("--cache-size", type=int, default=0, help="Remember the cost of up to this many sequences per search (0: off).")
+    parser.add_argument("--restarts", type=int, default=0, help="Random starting sequences searched besides the dispatching rules.")
+    parser.add_argument("--search-workers", type=int, default=1,
+                        help="Worker processes sharing the starts of one Local Search or Meta-Heuristic run (0: all cores).")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="results", help="Directory for objectives.csv and sequences.jsonl.")
+    parser.add_argument("--gantt", choices=["png", "svg"], default=None, help="Also save a Gantt chart per instance in this format.")
+    parser.add_argument("--stats", action="store_true", help="Save evaluation counts, phase timings and convergence traces per instance.")
+    parser.add_argument("--profile", action="store_true", help="Profile each instance with cProfile and save the report.")
+    arguments = parser.parse_args(argv)
+    if arguments.problem == "Single":
+        arguments.machines = 1
+    if arguments.speeds is not None:
+        if arguments.problem != "Parallel":
+            parser.error("Machine speeds are only available for Parallel.")
+        try:
+            arguments.speeds = [float(speed) for speed in arguments.speeds.split(",")]
+        except ValueError:
+            parser.error("Machine speeds must be numbers.")
+        if arguments.machines is not None and arguments.machines != len(arguments.speeds):
+            parser.error("Give one speed per machine.")
+    if arguments.machines is not None and arguments.machines <= 0:
+        parser.error("Number of machines must be greater than 0.")
+    if arguments.method == "NEH Insertion" and arguments.problem != "Flowshop":
+        parser.error("NEH Insertion is only available for Flowshop.")
+    if arguments.method == "Exact" and arguments.problem != "Single":
+        parser.error("Exact is only available for Single.")
+    if arguments.population_size < 2:
+        parser.error("Population size must be at least 2.")
+    if arguments.iterations < 0 or arguments.stagnation_limit < 0:
+        parser.error("Iterations and the stagnation limit can not be negative.")
+    if arguments.iterations == 0 and arguments.time_limit is None:
+        if arguments.method in POPULATION_METHODS:
+            parser.error(f"{arguments.method} needs --time-limit when --iterations is 0.")
+        if arguments.stagnation_limit == 0:
+            parser.error("--iterations 0 needs --time-limit or --stagnation-limit.")
+    if arguments.restarts < 0:
+        parser.error("Restarts can not be negative.")
+    if arguments.search_workers < 0:
+        parser.error("Search workers can not be negative.")
+    #The multi-start search takes None for all cores.
+    arguments.search_workers = arguments.search_workers or None
+    return arguments
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+    paths = find_instances(arguments.instances)
+    if not paths:
+        print("No instance files found.", file=sys.stderr)
+        return 1
+    settings = {name: getattr(arguments, name) for name in ("problem", "machines", "speeds", "rule", "method", "threshold", "objective", "iterations",
+                                                       "stagnation_limit", "cooling", "cache_size", "neighborhood", "strategy", "time_limit", "population_size", "restarts",
+                                                       "search_workers", "seed", "output", "gantt", "stats", "profile")}
+    os.makedirs(arguments.output, exist_ok=True)
+
+    started = time.perf_counter()
+    failures = 0
+    workers = arguments.workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 8))
+    with open(os.path.join(arguments.output, "objectives.csv"), "w", newline="") as objectives_file, \
+            open(os.path.join(arguments.output, "sequences.jsonl"), "w") as sequences_file, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        writer = csv.writer(objectives_file)
+        writer.writerow(["instance"] + OBJECTIVES + ["seconds", "error"])
+        for record in pool.map(solve_instance, [(path, settings) for path in paths], chunksize=chunksize):
+            objectives = record.get("objectives", {})
+            writer.writerow([record["instance"]] + [objectives.get(name, "") for name in OBJECTIVES] + [f"{record['seconds']:.4f}", record.get("error", "")])
+            sequences_file.write(json.dumps(record) + "\n")
+            failures += "error" in record
+
+    elapsed = time.perf_counter() - started
+    print(f"Solved {len(paths) - failures}/{len(paths)} instances in {elapsed:.1f} s "
+          f"({len(paths) / elapsed * 60:.1f} instances per minute), results in {arguments.output}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2613 @@
+import numpy as np
+from collections import namedtuple, OrderedDict
+from types import MappingProxyType
+import contextlib
+import heapq
+import io
+import itertools
+import json
+import math
+import random
+import re
+import time
+
+#The solver core: the instance model, the dispatching rules, the machine and flowshop evaluators and the searches.
+#It needs only NumPy. pandas (only to convert a DataFrame in build_job_table) and the process pool and profiler are
+#imported where they are used, so short solver runs start without them. Reading instance files is in scheduling_io,
+#the charts in scheduling_plots and the GUI in Group6_FinalProject.
+
+#Job data is converted once into read-only arrays so that evaluators never touch pandas in their loops.
+#stage_times is the (jobs x machines) matrix of times per machine (flowshop stages, or unrelated parallel machines), and
+#eligible the (jobs x machines) mask of machines a parallel job may use; either has no columns when it does not apply.
+class JobTable(namedtuple("JobTable", ["job_numbers", "process_time", "due_date", "weight", "release_date", "stage_times", "eligible",
+                                       "row_of"])):
+    __slots__ = ()
+
+    #row_of is a read-only view that cannot be pickled, so worker processes rebuild it from the arrays.
+    def __reduce__(self):
+        return (make_job_table, tuple(self[:-1]))
+
+INSTANCE_FIELDS = ['job_numbers', 'process_time', 'due_date', 'weight', 'release_date', 'stage_times', 'eligible']
+
+#Flowshop times per machine come wide, as 'process time 1' ... 'process time m' columns, or long, as one row per
+#job and machine with a 'machine' column next to 'process time'.
+STAGE_COLUMN = re.compile(r"process time (\d+)$")
+
+def stage_columns(columns):
+    numbered = sorted((int(match.group(1)), name) for name in columns if (match := STAGE_COLUMN.match(name)))
+    if [number for number, _ in numbered] != list(range(1, len(numbered) + 1)):
+        raise ValueError("Per-machine columns must be numbered 'process time 1' to 'process time m'.")
+    return [name for _, name in numbered]
+
+#Parallel jobs restricted to some machines list them in an 'eligible machines' column ("1, 3"); an empty cell means any.
+ELIGIBLE_COLUMN = 'eligible machines'
+
+def eligibility_mask(cells):
+    listed = []
+    for cell in cells:
+        text = '' if cell is None or (isinstance(cell, float) and math.isnan(cell)) else str(cell).strip()
+        try:
+            listed.append([int(float(number)) for number in re.split(r"[,;\s]+", text) if number] if text else None)
+        except ValueError:
+            raise ValueError(f"Column '{ELIGIBLE_COLUMN}' must list machine numbers, not '{cell}'.")
+    if any(number < 1 for numbers in listed if numbers for number in numbers):
+        raise ValueError(f"Column '{ELIGIBLE_COLUMN}' numbers machines from 1.")
+    width = max((max(numbers) for numbers in listed if numbers), default=0)
+    mask = np.ones((len(listed), width), dtype=bool)
+    for row, numbers in enumerate(listed):
+        if numbers is not None:
+            mask[row] = False
+            mask[row, np.array(numbers, dtype=np.intp) - 1] = True
+    return mask
+
+def make_job_table(job_numbers, process_time, due_date, weight, release_date, stage_times=None, eligible=None):
+    if stage_times is None:
+        stage_times = np.zeros((len(job_numbers), 0), dtype=np.asarray(process_time).dtype)
+    if eligible is None:
+        eligible = np.zeros((len(job_numbers), 0), dtype=bool)
+    if len(stage_times) != len(job_numbers) or len(eligible) != len(job_numbers):
+        raise ValueError("Per-machine process times must have one row per job.")
+    #C order keeps each job's machine times together for the row-by-row flowshop recurrence.
+    arrays = [np.ascontiguousarray(values) for values in (job_numbers, process_time, due_date, weight, release_date, stage_times, eligible)]
+    for values in arrays:
+        values.flags.writeable = False
+    row_of = MappingProxyType({job: row for row, job in enumerate(arrays[0].tolist())})
+    if len(row_of) != len(arrays[0]):
+        raise ValueError("Job numbers must be unique.")
+    return JobTable(*arrays, row_of)
+
+def build_job_table(jobs):
+    if isinstance(jobs, JobTable):
+        return jobs
+    import pandas as pd
+
+    def column(name, required=True):
+        if name not in jobs.columns:
+            if required:
+                raise ValueError(f"Missing required columns in job data: '{name}'")
+            return np.zeros(len(jobs), dtype=np.int64)
+        return pd.to_numeric(jobs[name]).to_numpy()
+
+    stages = stage_columns(jobs.columns)
+    stage_times = np.column_stack([column(name) for name in stages]) if stages else None
+    process_time = stage_times.sum(axis=1) if stages and 'process time' not in jobs.columns else column('process time')
+    eligible = eligibility_mask(jobs[ELIGIBLE_COLUMN].tolist()) if ELIGIBLE_COLUMN in jobs.columns else None
+    return make_job_table(jobs.index.to_numpy(), process_time, column('due date'), column('weight'),
+                          column('release date', required=False), stage_times, eligible)
+
+def with_machine_speeds(table, speeds):
+    #Uniform machines: machine i takes a job's time divided by speeds[i], applied to the instance's per-machine
+    #times when it has them. Whole-number results stay integers.
+    speeds = np.asarray(speeds, dtype=np.float64)
+    if (speeds <= 0).any():
+        raise ValueError("Machine speeds must be positive.")
+    base = table.stage_times if table.stage_times.shape[1] else table.process_time[:, None]
+    if base.shape[1] not in (1, len(speeds)):
+        raise ValueError(f"The instance has process times for {base.shape[1]} machines, not {len(speeds)}.")
+    machine_times = base / speeds
+    if np.issubdtype(base.dtype, np.integer) and np.array_equal(machine_times, np.round(machine_times)):
+        machine_times = machine_times.astype(base.dtype)
+    return make_job_table(table.job_numbers, table.process_time, table.due_date, table.weight, table.release_date, machine_times,
+                          table.eligible)
+
+class MachinePool:
+    #Earliest-completion-time assignment on machines that differ in speed or eligibility. Machines with the same
+    #time and eligibility columns are interchangeable, so each such class keeps one heap of (free time, machine) and a
+    #job only looks at the top of every class: O(classes + log m) per job, O(n log m) with a few machine types.
+    #Ties go to the earlier free machine and then the lower machine number.
+    #Uniform machines (a job's time on class k is p * c[k]) of many different speeds use a segment tree over the
+    #classes, fastest first, instead. A job of length p finishes on class k at max(f[k], release) + p * c[k], and
+    #the lowest f[k] + p * c[k] below a node is concave in p, so each node keeps it at a few values of p and a job
+    #reads a lower bound for the node off the chord between its neighbouring values. The search from the fast end
+    #skips every node whose bound can not beat the best machine found so far and an update rewrites one path, so a
+    #job costs O(log classes) node visits as long as the chords are close to the envelope, which they are for
+    #machines that a schedule keeps about equally busy.
+    def __init__(self, machine_times, eligible, tree_classes=256, samples=8):
+        self.machine_times = machine_times
+        self.eligible = eligible
+        self.restricted = not eligible.all()
+        columns = np.vstack([machine_times, eligible]).T
+        _, first, class_of = np.unique(columns, axis=0, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        self.class_of = rank[class_of.ravel()].tolist()
+        self.members = [[] for _ in order]
+        for machine, machine_class in enumerate(self.class_of):
+            self.members[machine_class].append(machine)
+        class_times = machine_times[:, first[order]]
+        self.times = class_times.tolist()
+        self.allowed = eligible[:, first[order]].tolist()
+        self.size = 0
+        if not self.restricted and len(order) >= tree_classes:
+            self._build_tree(class_times, samples)
+
+    def _build_tree(self, class_times, samples):
+        #Only for uniform machines: every column a multiple of the fastest one, up to rounding of the divisions.
+        fastest = class_times.min(axis=1)
+        scale = class_times.sum(axis=0) / max(fastest.sum(), 1)
+        if not np.allclose(class_times, fastest[:, None] * scale, rtol=1e-9, atol=0):
+            return
+        by_speed = np.argsort(scale, kind='stable')
+        self.size = 1 << (len(scale) - 1).bit_length()
+        self.leaf_of = np.empty(len(scale), dtype=np.intp)
+        self.leaf_of[by_speed] = self.size + np.arange(len(scale))
+        self.leaf_of = self.leaf_of.tolist()
+        #Class at each leaf (padding leaves repeat the slowest) and the fastest class below each node.
+        self.leaf_class = by_speed.tolist() + [by_speed[-1].item()] * (self.size - len(scale))
+        self.fastest = [0] * self.size + self.leaf_class
+        for node in range(self.size - 1, 0, -1):
+            self.fastest[node] = self.fastest[2 * node]
+        self.scale = scale.tolist()
+        #The envelope is kept at 0 and at quantiles of the job lengths; each job reads the chord around its length.
+        grid = np.unique(np.concatenate([[0.0], np.quantile(fastest, np.linspace(0, 1, samples))]))
+        if len(grid) < 2:
+            grid = np.array([0.0, 1.0])
+        self.grid = grid.tolist()
+        chord = np.minimum(np.searchsorted(grid, fastest, side='right') - 1, len(grid) - 2)
+        weight = (fastest - grid[chord]) / (grid[chord + 1] - grid[chord])
+        self.chord = list(zip(chord.tolist(), weight.tolist()))
+
+    def start_state(self):
+        heaps = [[(0, machine) for machine in members] for members in self.members]
+        if not self.size:
+            return heaps
+        #Node k holds the envelope at every grid length; padding leaves stay at infinity.
+        tree = [(math.inf,) * len(self.grid)] * (2 * self.size)
+        for machine_class, leaf in enumerate(self.leaf_of):
+            tree[leaf] = tuple(length * self.scale[machine_class] for length in self.grid)
+        for node in range(self.size - 1, 0, -1):
+            tree[node] = tuple(map(min, tree[2 * node], tree[2 * node + 1]))
+        return heaps, tree
+
+    #A state as a tuple that later searches restart from; the tree's nodes are tuples already.
+    def snapshot(self, state):
+        if not self.size:
+            return tuple(tuple(heap) for heap in state)
+        heaps, tree = state
+        return tuple(tuple(heap) for heap in heaps), tuple(tree)
+
+    def restore(self, snapshot):
+        if not self.size:
+            return [list(heap) for heap in snapshot]
+        heaps, tree = snapshot
+        return [list(heap) for heap in heaps], list(tree)
+
+    def latest(self, state):
+        #The last time any machine is busy until.
+        heaps = state[0] if self.size else state
+        return max(max(heap)[0] for heap in heaps)
+
+    def assign(self, state, row, release=0):
+        #Puts job row on the machine where it finishes first; returns (machine, start, end).
+        times = self.times[row]
+        if self.size:
+            return self._assign_tree(state, row, times, release)
+        chosen, best = -1, 0
+        for machine_class, (heap, allowed) in enumerate(zip(state, self.allowed[row])):
+            if allowed:
+                free = heap[0][0]
+                end = (free if free > release else release) + times[machine_class]
+                if chosen < 0 or end < best or end == best and heap[0] < state[chosen][0]:
+                    chosen, best = machine_class, end
+        machine = state[chosen][0][1]
+        heapq.heapreplace(state[chosen], (best, machine))
+        return machine, best - times[chosen], best
+
+    def _assign_tree(self, state, row, times, release):
+        heaps, tree = state
+        fastest, leaf_class, size = self.fastest, self.leaf_class, self.size
+        chord, weight = self.chord[row]
+
+        def bound(node):
+            envelope = tree[node]
+            low = envelope[chord]
+            if low == math.inf:
+                return math.inf
+            envelope = low + weight * (envelope[chord + 1] - low)
+            floor = release + times[fastest[node]]
+            #The envelope is kept in p * c, which may round differently from the job's own times.
+            return (envelope if envelope > floor else floor) * (1 - 1e-9)
+
+        #Depth first, the child with the lower bound first, so the first leaf reached is usually the answer.
+        chosen = None
+        stack = [(0, 1)]
+        while stack:
+            lower, node = stack.pop()
+            if chosen is not None and lower > chosen[0]:
+                continue
+            if node >= size:
+                machine_class = leaf_class[node - size]
+                free, machine = heaps[machine_class][0]
+                key = ((free if free > release else release) + times[machine_class], free, machine)
+                if chosen is None or key < chosen:
+                    chosen, leaf = key, node
+                continue
+            left, right = (bound(2 * node), 2 * node), (bound(2 * node + 1), 2 * node + 1)
+            if left[0] <= right[0]:
+                stack.append(right)
+                stack.append(left)
+            else:
+                stack.append(left)
+                stack.append(right)
+        best, _, machine = chosen
+        machine_class = leaf_class[leaf - size]
+        heap = heaps[machine_class]
+        heapq.heapreplace(heap, (best, machine))
+        free, scale = heap[0][0], self.scale[machine_class]
+        tree[leaf] = tuple(free + length * scale for length in self.grid)
+        #Free times only grow, so the path stops changing at the first node whose envelope stays the same.
+        node = leaf // 2
+        while node:
+            envelope = tuple(map(min, tree[2 * node], tree[2 * node + 1]))
+            if envelope == tree[node]:
+                break
+            tree[node] = envelope
+            node //= 2
+        return machine, best - times[machine_class], best
+
+def machine_eligibility(table, machines):
+    #The (jobs x machines) mask. A file that names fewer machines than are scheduled keeps its restricted jobs on the
+    #machines it lists; jobs allowed on every listed machine may use the extra ones too.
+    eligible = table.eligible
+    if eligible.shape[1] > machines and eligible[:, machines:].any():
+        raise ValueError(f"Column '{ELIGIBLE_COLUMN}' refers to machines above {machines}.")
+    mask = np.ones((len(eligible), machines), dtype=bool)
+    width = min(eligible.shape[1], machines)
+    mask[:, :width] = eligible[:, :width]
+    if width < machines:
+        mask[:, width:] = eligible.all(axis=1)[:, None]
+    stuck = ~mask.any(axis=1)
+    if stuck.any():
+        raise ValueError(f"Job {table.job_numbers[np.argmax(stuck)]} can not run on any of the {machines} machines.")
+    return mask
+
+def machine_pool(table, machines):
+    #None for identical machines, else the MachinePool of the instance's per-machine times and eligibility.
+    if not table.stage_times.shape[1] and not table.eligible.shape[1]:
+        return None
+    if machines == 1 and table.stage_times.shape[1] > 1 and not table.eligible.shape[1]:
+        #A single machine runs a flowshop file's jobs in their total work.
+        return None
+    if table.stage_times.shape[1]:
+        if table.stage_times.shape[1] != machines:
+            raise ValueError(f"The instance has process times for {table.stage_times.shape[1]} machines, not {machines}.")
+        machine_times = table.stage_times
+    else:
+        machine_times = np.broadcast_to(table.process_time[:, None], (len(table.process_time), machines))
+    return MachinePool(machine_times, machine_eligibility(table, machines))
+
+def sequence_to_rows(table, sequence):
+    row_of = table.row_of
+    return np.fromiter((row_of[job] for job in sequence), dtype=np.intp, count=len(sequence))
+
+def rows_to_sequence(table, rows):
+    return table.job_numbers[rows].tolist()
+
+def machine_schedule(process_time, rows, machines, rule, release_date=None, pool=None):
+    #Machine and start time of every position; the evaluators and the Gantt chart both build on this.
+    #With release dates a job starts at the later of its machine becoming free and its arrival.
+    #A MachinePool (machines of different speeds or eligibility) replaces process_time by its per-machine times.
+    times = process_time[rows]
+    if pool is not None and rule == "Wrap-Around":
+        if pool.restricted:
+            raise ValueError("Wrap-Around can not respect machine eligibility.")
+        times = pool.machine_times[rows, np.arange(len(rows)) % machines]
+    released = release_date is not None and release_date.any()
+    time_type = np.result_type(times, release_date) if released else times.dtype
+    if rule == "Wrap-Around":
+        #Every machine gets each m-th job, so completion times are running sums per machine.
+        padded = np.zeros(-(-len(times) // machines) * machines, dtype=time_type)
+        padded[:len(times)] = times
+        padded = padded.reshape(-1, machines)
+        totals = np.cumsum(padded, axis=0)
+        if released:
+            #C[k] = max(C[k-1], r[k]) + p[k] unrolls to S[k] + max(0, max over j <= k of r[j] - S[j-1]) per machine.
+            arrivals = np.zeros(padded.size, dtype=time_type)
+            arrivals[:len(times)] = release_date[rows]
+            totals += np.maximum(np.maximum.accumulate(arrivals.reshape(-1, machines) - (totals - padded), axis=0), 0)
+        end = totals.ravel()[:len(times)]
+        return np.arange(len(times)) % machines, end - times, end
+    if pool is not None:
+        state = pool.start_state()
+        arrivals = release_date[rows].tolist() if released else [0] * len(rows)
+        assigned, starts, ends = zip(*(pool.assign(state, row, arrival) for row, arrival in zip(rows.tolist(), arrivals))) if len(rows) else ((), (), ())
+        time_type = np.result_type(pool.machine_times, release_date) if released else pool.machine_times.dtype
+        return np.array(assigned, dtype=np.intp), np.array(starts, dtype=time_type), np.array(ends, dtype=time_type)
+    #The least loaded machine is popped from a heap of (load, machine) pairs; ties go to the lowest
+    #machine number exactly like machine_times.index(min(machine_times)).
+    heap = [(0, machine_index) for machine_index in range(machines)]
+    arrivals = release_date[rows].tolist() if released else None
+    assigned = []
+    starts = []
+    for position, duration in enumerate(times.tolist()):
+        start_time, machine_index = heap[0]
+        if arrivals is not None and arrivals[position] > start_time:
+            start_time = arrivals[position]
+        heapq.heapreplace(heap, (start_time + duration, machine_index))
+        assigned.append(machine_index)
+        starts.append(start_time)
+    start = np.array(starts, dtype=time_type)
+    return np.array(assigned, dtype=np.intp), start, start + times
+
+def feasible_rules(table, machines, rules):
+    #Wrap-Around fixes the machine of every position, which machine eligibility may forbid.
+    pool = machine_pool(table, machines)
+    return [rule for rule in rules if rule != "Wrap-Around" or pool is None or not pool.restricted]
+
+def online_dispatch_rows(table, machines, rule):
+    #Event-driven dispatching for jobs that arrive over time: whenever a machine frees up the rule picks among the
+    #jobs released by then, kept in a heap by their rank under the rule, and an idle machine waits for the next
+    #arrival. O(n log n); the returned order replays to the same schedule under machine_schedule.
+    by_rank = dispatching_rows(table, rule)
+    rank = np.empty_like(by_rank)
+    rank[by_rank] = np.arange(len(by_rank))
+    arrivals = np.argsort(table.release_date, kind='stable')
+    release = table.release_date[arrivals].tolist()
+    process_time = table.process_time.tolist()
+    rank, by_rank, arrivals = rank.tolist(), by_rank.tolist(), arrivals.tolist()
+    machine_heap = [(0, machine_index) for machine_index in range(machines)]
+    ready = []
+    order = []
+    next_arrival = 0
+    clock = 0
+    while len(order) < len(arrivals):
+        free_time, machine_index = machine_heap[0]
+        #A machine that was idle while another one waited for an arrival can not start before that arrival either.
+        free_time = max(free_time, clock)
+        if not ready and release[next_arrival] > free_time:
+            free_time = release[next_arrival]
+        clock = free_time
+        while next_arrival < len(arrivals) and release[next_arrival] <= free_time:
+            heapq.heappush(ready, rank[arrivals[next_arrival]])
+            next_arrival += 1
+        row = by_rank[heapq.heappop(ready)]
+        order.append(row)
+        heapq.heapreplace(machine_heap, (free_time + process_time[row], machine_index))
+    return np.array(order, dtype=np.intp)
+
+def build_schedule(table, rows, machines, problem="Parallel", rule=None):
+    #The schedule of a sequence as one record per operation: (job row, machine, start, end), grouped by job in
+    #sequence order. Objectives, completion times and Gantt charts are all read from this array.
+    rows = np.asarray(rows, dtype=np.intp)
+    if problem == "Flowshop":
+        stage_times = flowshop_stage_times(table, machines)
+        _, completion = flowshop_makespans(flowshop_cumulative_times(stage_times), rows, return_completion=True)
+        end = completion[0]
+        start = end - stage_times[rows]
+        assigned = np.tile(np.arange(machines), len(rows))
+        rows = np.repeat(rows, machines)
+    else:
+        assigned, start, end = machine_schedule(table.process_time, rows, machines, rule, table.release_date, machine_pool(table, machines))
+    schedule = np.empty(rows.size, dtype=[('row', np.intp), ('machine', np.intp), ('start', end.dtype), ('end', end.dtype)])
+    schedule['row'] = rows
+    schedule['machine'] = assigned
+    schedule['start'] = start.ravel()
+    schedule['end'] = end.ravel()
+    return schedule
+
+def schedule_completion(schedule):
+    #Job rows in sequence order and their completion times, i.e. the end of each job's last operation.
+    last = np.flatnonzero(np.append(schedule['row'][1:] != schedule['row'][:-1], True)) if schedule.size else np.arange(0)
+    return schedule['row'][last], schedule['end'][last]
+
+def calculate_completion_times(machines, jobs, sequence,rule):
+    table = build_job_table(jobs)
+    _, completion = schedule_completion(build_schedule(table, sequence_to_rows(table, sequence), machines, rule=rule))
+    return dict(zip(sequence, completion.tolist()))
+
+OBJECTIVES = ["Makespan", "Total completion time", "Total tardiness", "Total weighted completion",
+              "Total lateness (Uj)", "Total weighted lateness (WjUj)", "Total weighted tardiness (WjTj)"]
+
+def objective_matrix(completion, due_date, weight):
+    #All seven objectives in one pass: completion, due_date and weight are (..., jobs) arrays aligned by position
+    #and the result is (..., 7) in the order of OBJECTIVES.
+    tardiness = np.maximum(completion - due_date, 0)
+    late = completion > due_date
+    per_job = np.stack([completion, tardiness, completion * weight, late, weight * late, weight * tardiness], axis=-1)
+    return np.concatenate([completion.max(axis=-1, keepdims=True), per_job.sum(axis=-2)], axis=-1)
+
+def objective_weights(objective):
+    #The search target is one objective name or a {name: weight} combination of them.
+    if isinstance(objective, str):
+        objective = {objective: 1}
+    unknown = [name for name in objective if name not in OBJECTIVES]
+    if unknown:
+        raise ValueError(f"Unknown objectives: {', '.join(unknown)}")
+    return np.array([float(objective.get(name, 0)) for name in OBJECTIVES])
+
+def job_costs(completion, due_date, weight, weights):
+    #Per-job share of the weighted objective; the makespan term is added separately since it is not a sum.
+    tardiness = np.maximum(completion - due_date, 0)
+    late = completion > due_date
+    return (weights[1] * completion + weights[2] * tardiness + weights[3] * completion * weight
+            + weights[4] * late + weights[5] * weight * late + weights[6] * weight * tardiness)
+
+def objectives_from_arrays(table, rows, completion):
+    due_date = table.due_date[rows]
+    weight = table.weight[rows]
+    values = objective_matrix(completion, due_date, weight)
+    #Each value keeps the type of the inputs it depends on, so fractional due dates or weights are never truncated.
+    tardiness = np.result_type(completion, due_date)
+    kinds = [completion.dtype, completion.dtype, tardiness, np.result_type(completion, weight), np.int64, weight.dtype,
+             np.result_type(tardiness, weight)]
+    return {name: value.astype(kind).item() for name, value, kind in zip(OBJECTIVES, values, kinds)}
+
+def calculate_objectives(jobs, sequence, job_completion_times):
+    table = build_job_table(jobs)
+    completion = np.array([job_completion_times[job] for job in sequence])
+    return objectives_from_arrays(table, sequence_to_rows(table, sequence), completion)
+
+def schedule_objectives(table, schedule):
+    rows, completion = schedule_completion(schedule)
+    return objectives_from_arrays(table, rows, completion)
+
+def dispatching_rows(table, rule):
+    if rule == "SPT":
+        return np.argsort(table.process_time, kind='stable')
+    elif rule == "WSPT":
+        return np.argsort(table.process_time / table.weight, kind='stable')
+    elif rule == "LPT":
+        return np.argsort(-table.process_time, kind='stable')
+    elif rule == "EDD":
+        return np.argsort(table.due_date, kind='stable')
+    elif rule == "ERD":
+        return np.argsort(table.release_date, kind='stable')
+    elif rule == "Wrap-Around":
+        return np.argsort(table.job_numbers, kind='stable')
+    else:
+        raise ValueError("Invalid rule.")
+
+def apply_dispatching_rule(jobs, rule):
+    table = build_job_table(jobs)
+    return rows_to_sequence(table, dispatching_rows(table, rule))
+
+#Every search draws from its own NumPy Generator. A search passed rng=None gets one seeded from the global random
+#module, so random.seed() still fixes a run; parallel starts get independent children of one SeedSequence.
+def search_rng(rng=None):
+    if isinstance(rng, np.random.Generator):
+        return rng
+    if rng is None:
+        return np.random.default_rng(random.getrandbits(64))
+    return np.random.default_rng(rng)
+
+def uniform_stream(rng, batch=1024):
+    #Uniform [0, 1) numbers drawn batch at a time and handed out one by one.
+    while True:
+        yield from rng.random(batch).tolist()
+
+def random_swap_pairs(length, size, rng=None):
+    #size random position pairs (i != j) as a (size x 2) array, from two vectorized draws; none if length < 2.
+    rng = search_rng(rng)
+    if length < 2:
+        return np.empty((0, 2), dtype=np.intp)
+    pairs = np.empty((size, 2), dtype=np.intp)
+    pairs[:, 0] = rng.integers(0, length, size)
+    pairs[:, 1] = rng.integers(0, length - 1, size)
+    pairs[:, 1] += pairs[:, 1] >= pairs[:, 0]
+    return pairs
+
+def swap_block(sequence, pairs, out=None):
+    block = np.tile(sequence, (len(pairs), 1)) if out is None else out
+    if out is not None:
+        block[:] = sequence
+    candidates = np.arange(len(pairs))
+    block[candidates, pairs[:, 0]], block[candidates, pairs[:, 1]] = block[candidates, pairs[:, 1]], block[candidates, pairs[:, 0]]
+    return block
+
+#Neighborhood operators. A move is a tuple of positions: apply() changes a sequence (a list or an array) in place,
+#inverse() is the move that undoes it and span() the positions [lo, hi) it touches. The moves of a sequence of
+#length n are numbered 0 .. size(n) - 1, so a scan can visit all of them once in a random order without storing them.
+#Random moves come from a NumPy Generator, count at a time (sample) or as an endless stream drawn in batches.
+#A sequence too short for the move (two jobs for a block of two, one job for a swap) has no moves: sample and
+#the stream return none, random returns None and the searches keep their start.
+class SwapMoves:
+    #Exchange the jobs at positions i < j.
+    def size(self, n):
+        return n * (n - 1) // 2
+
+    def move(self, n, index):
+        j = (1 + math.isqrt(1 + 8 * index)) // 2
+        return index - j * (j - 1) // 2, j
+
+    def sample(self, n, count, rng):
+        return self.draw(n, count, rng) if self.size(n) else []
+
+    def draw(self, n, count, rng):
+        return list(zip(*random_swap_pairs(n, count, rng).T.tolist()))
+
+    def random(self, n, rng):
+        moves = self.sample(n, 1, rng)
+        return moves[0] if moves else None
+
+    def stream(self, n, rng, batch=1024):
+        while self.size(n):
+            yield from self.sample(n, batch, rng)
+
+    def scan(self, n, rng):
+        #Steps through the numbered moves with a random stride coprime to their count: a random order, each move once.
+        size = self.size(n)
+        if size == 0:
+            return
+        start = int(rng.integers(size))
+        step = int(rng.integers(1, size)) if size > 2 else 1
+        while math.gcd(step, size) != 1:
+            step = int(rng.integers(1, size))
+        for k in range(size):
+            yield self.move(n, (start + k * step) % size)
+
+    def span(self, move):
+        i, j = move
+        return min(i, j), max(i, j) + 1
+
+    def inverse(self, move):
+        return move
+
+    def apply(self, sequence, move):
+        i, j = move
+        sequence[i], sequence[j] = sequence[j], sequence[i]
+
+class AdjacentSwapMoves(SwapMoves):
+    def size(self, n):
+        return max(n - 1, 0)
+
+    def move(self, n, index):
+        return index, index + 1
+
+    def draw(self, n, count, rng):
+        first = rng.integers(0, n - 1, count).tolist()
+        return [(i, i + 1) for i in first]
+
+class ReversalMoves(SwapMoves):
+    #2-opt: reverse the jobs at positions i .. j.
+    def draw(self, n, count, rng):
+        pairs = random_swap_pairs(n, count, rng)
+        pairs.sort(axis=1)
+        return list(zip(*pairs.T.tolist()))
+
+    def apply(self, sequence, move):
+        i, j = move
+        sequence[i:j + 1] = sequence[i:j + 1][::-1]
+
+class BlockMoves(SwapMoves):
+    #Move the jobs at positions i .. j - 1 so that they start at position k; insertion is a block of one job.
+    def __init__(self, lengths):
+        self.lengths = lengths
+
+    def size(self, n):
+        return sum((n - length + 1) * (n - length) for length in self.lengths if length < n)
+
+    def move(self, n, index):
+        for length in self.lengths:
+            if length >= n:
+                continue
+            count = (n - length + 1) * (n - length)
+            if index < count:
+                i, k = divmod(index, n - length)
+                return i, i + length, k + (k >= i)
+            index -= count
+        raise IndexError("Move number out of range.")
+
+    def draw(self, n, count, rng):
+        return [self.move(n, index) for index in rng.integers(0, self.size(n), count).tolist()]
+
+    def span(self, move):
+        i, j, k = move
+        return min(i, k), max(i, k) + j - i
+
+    def inverse(self, move):
+        i, j, k = move
+        return k, k + j - i, i
+
+    def apply(self, sequence, move):
+        i, j, k = move
+        length = j - i
+        block = sequence[i:j].copy()
+        if k < i:
+            sequence[k + length:j] = sequence[k:i]
+        else:
+            sequence[i:k] = sequence[j:k + length]
+        sequence[k:k + length] = block
+
+NEIGHBORHOODS = {"Swap": SwapMoves(), "Adjacent Swap": AdjacentSwapMoves(), "Insertion": BlockMoves((1,)),
+                 "Block Move": BlockMoves((2, 3)), "2-opt": ReversalMoves()}
+#Random samples moves (the annealer always does); the improvement scans walk the whole neighborhood of the current sequence.
+STRATEGIES = ["Random", "First Improvement", "Best Improvement"]
+
+def neighborhood_moves(neighborhood):
+    if neighborhood not in NEIGHBORHOODS:
+        raise ValueError(f"Unknown neighborhood: {neighborhood}")
+    return NEIGHBORHOODS[neighborhood]
+
+#Sequences are identified by a Zobrist-style hash: the XOR of a key per (position, job row). A swap changes four
+#keys, so the hash of every neighbour is known in O(1) without building it. A key is two independent 64-bit
+#hashes side by side: the cache finds an entry by the low one and checks the high one (see EvaluationCache).
+_MASK64 = (1 << 64) - 1
+
+def _splitmix64(value):
+    value = value + 0x9E3779B97F4A7C15 & _MASK64
+    value = (value ^ value >> 30) * 0xBF58476D1CE4E5B9 & _MASK64
+    value = (value ^ value >> 27) * 0x94D049BB133111EB & _MASK64
+    return value ^ value >> 31
+
+def zobrist_key(position, row):
+    value = position << 32 | row
+    return _splitmix64(value ^ 0x5851F42D4C957F2D) << 64 | _splitmix64(value)
+
+def sequence_hash(rows):
+    value = 0
+    for position, row in enumerate(rows.tolist()):
+        value ^= zobrist_key(position, row)
+    return value
+
+def swap_hash(rows, i, j):
+    first, second = int(rows[i]), int(rows[j])
+    return zobrist_key(i, first) ^ zobrist_key(j, second) ^ zobrist_key(i, second) ^ zobrist_key(j, first)
+
+def span_hash(rows, lo, hi):
+    #The keys of positions lo .. hi - 1; the hash of a neighbour is hash ^ span_hash(before) ^ span_hash(after).
+    value = 0
+    for position, row in enumerate(rows[lo:hi].tolist(), start=lo):
+        value ^= zobrist_key(position, row)
+    return value
+
+class EvaluationCache:
+    #Bounded map from sequence hash to cost; the least recently used entry is dropped when it is full. Entries are
+    #found by the low 64 bits of the hash and keep the high 64 bits next to the cost: a lookup whose high bits differ
+    #is a collision of the low hash and counts as a miss, so a wrong cost needs both hashes to collide at once.
+    def __init__(self, maxsize=1 << 16):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self.salt = 0
+
+    def invalidate(self):
+        #The instance changed. Keys are mixed with a key of the instance version (a position no sequence reaches), so
+        #costs of older versions are never returned and leave through the LRU order instead of an O(size) clear.
+        self.version += 1
+        self.salt = zobrist_key(0xFFFFFFFF, self.version)
+
+    def get(self, key):
+        key ^= self.salt
+        index = key & _MASK64
+        entry = self.entries.get(index)
+        if entry is None or entry[0] != key >> 64:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(index)
+        return entry[1]
+
+    def put(self, key, cost):
+        key ^= self.salt
+        index = key & _MASK64
+        self.entries[index] = (key >> 64, cost)
+        self.entries.move_to_end(index)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+class ParallelSwapEvaluator:
+    #Keeps the schedule state of the current sequence so a swap of positions i and j is scored without
+    #re-simulating the unchanged prefix. The machine loads (a heap for list scheduling) are stored before every
+    #stride-th position together with prefix sums of the per-job objective costs. For makespan under Wrap-Around
+    #each position's machine is fixed, so without release dates a swap only moves load between two machines.
+    #An optional EvaluationCache returns the cost of a sequence that was already scored, e.g. a swap that undoes one.
+    #Other neighborhoods apply their move in place, re-simulate from the first position it touches and undo it.
+    def __init__(self, table, rows, machines, rule, objective="Makespan", checkpoint_budget=1 << 20, cache=None, neighborhood="Swap", rng=None):
+        self.moves = neighborhood_moves(neighborhood)
+        self.swaps = neighborhood == "Swap"
+        self.batch = 1
+        self.rng = search_rng(rng)
+        self.machines = machines
+        self.rule = rule
+        self.weights = objective_weights(objective)
+        #Only the argmin matters to the search, so a makespan-only target is scored as the plain makespan.
+        self.makespan_only = not self.weights[1:].any()
+        self.checkpoint_budget = checkpoint_budget
+        self.shared_cache = cache
+        self.reset(table, rows)
+
+    def reset(self, table, rows):
+        #Points the search at another instance or sequence (an edited instance of a SolverSession); the objective,
+        #the random stream and the cache stay.
+        machines, rule = self.machines, self.rule
+        self.rows = np.array(rows)
+        self.stream = self.moves.stream(len(self.rows), self.rng)
+        self.times = table.process_time[self.rows].tolist()
+        self.releases = table.release_date[self.rows].tolist() if table.release_date.any() else None
+        self.due_date = table.due_date
+        self.weight = table.weight
+        #Machines of different speeds or eligibility are simulated through a MachinePool.
+        self.pool = machine_pool(table, machines)
+        if self.pool is not None and rule == "Wrap-Around" and self.pool.restricted:
+            raise ValueError("Wrap-Around can not respect machine eligibility.")
+        self.load_swaps = rule == "Wrap-Around" and self.makespan_only and self.releases is None and self.pool is None
+        #Load swaps are already O(1). The rule changes the schedule of a sequence, so it is folded into the hash.
+        self.cache = None if self.load_swaps else self.shared_cache
+        if self.cache is not None:
+            self.hash = sequence_hash(self.rows) ^ (rule == "Wrap-Around")
+        if self.load_swaps:
+            self.loads = [0] * machines
+            for position, duration in enumerate(self.times):
+                self.loads[position % machines] += duration
+            self.cost = max(self.loads)
+            return
+        self.stride = max(1, -(-len(self.times) * machines // self.checkpoint_budget))
+        if rule == "Wrap-Around":
+            self.checkpoints = [(0,) * machines]
+        elif self.pool is not None:
+            self.checkpoints = [self.pool.snapshot(self.pool.start_state())]
+        else:
+            self.checkpoints = [tuple((0, machine_index) for machine_index in range(machines))]
+        self.prefix_costs = np.zeros(len(self.times) + 1)
+        self.cost = self._simulate(0, record=True)
+        if self.cache is not None:
+            self.cache.put(self.hash, self.cost)
+
+    def _simulate(self, block, record=False):
+        stride, times, releases, machines, pool = self.stride, self.times, self.releases, self.machines, self.pool
+        fixed = self.rule == "Wrap-Around"
+        start = block * stride
+        classes = pool is not None and not fixed
+        state = pool.restore(self.checkpoints[block]) if classes else list(self.checkpoints[block])
+        if record:
+            del self.checkpoints[block + 1:]
+        if classes:
+            makespan = pool.latest(state)
+        else:
+            makespan = max(state) if fixed else max(state)[0]
+        rows = self.rows[start:].tolist() if pool is not None else None
+        completions = None if self.makespan_only else []
+        for position in range(start, len(times)):
+            if record and position % stride == 0 and position > start:
+                self.checkpoints.append(pool.snapshot(state) if classes else tuple(state))
+            if classes:
+                end_time = pool.assign(state, rows[position - start], releases[position] if releases is not None else 0)[2]
+            else:
+                if fixed:
+                    machine_index = position % machines
+                    end_time = state[machine_index]
+                else:
+                    end_time, machine_index = state[0]
+                if releases is not None and releases[position] > end_time:
+                    end_time = releases[position]
+                if pool is not None:
+                    end_time += pool.times[rows[position - start]][pool.class_of[machine_index]]
+                else:
+                    end_time += times[position]
+                if fixed:
+                    state[machine_index] = end_time
+                else:
+                    heapq.heapreplace(state, (end_time, machine_index))
+            if end_time > makespan:
+                makespan = end_time
+            if completions is not None:
+                completions.append(end_time)
+        if self.makespan_only:
+            return makespan
+        suffix_rows = self.rows[start:]
+        costs = job_costs(np.array(completions), self.due_date[suffix_rows], self.weight[suffix_rows], self.weights)
+        if record:
+            self.prefix_costs[start + 1:] = self.prefix_costs[start] + np.cumsum(costs)
+        return (self.weights[0] * makespan + self.prefix_costs[start] + costs.sum()).item()
+
+    def _swap(self, i, j):
+        times, rows, releases = self.times, self.rows, self.releases
+        times[i], times[j] = times[j], times[i]
+        rows[i], rows[j] = rows[j], rows[i]
+        if releases is not None:
+            releases[i], releases[j] = releases[j], releases[i]
+
+    def swap_cost(self, i, j):
+        times = self.times
+        if self.load_swaps:
+            first, second = i % self.machines, j % self.machines
+            if first == second:
+                return self.cost
+            loads = list(self.loads)
+            loads[first] += times[j] - times[i]
+            loads[second] += times[i] - times[j]
+            return max(loads)
+        if self.cache is not None:
+            key = self.hash ^ swap_hash(self.rows, i, j)
+            cost = self.cache.get(key)
+            if cost is not None:
+                return cost
+        self._swap(i, j)
+        cost = self._simulate(min(i, j) // self.stride)
+        self._swap(i, j)
+        if self.cache is not None:
+            self.cache.put(key, cost)
+        return cost
+
+    def apply_swap(self, i, j):
+        times = self.times
+        if self.load_swaps:
+            self.loads[i % self.machines] += times[j] - times[i]
+            self.loads[j % self.machines] += times[i] - times[j]
+            self.cost = max(self.loads)
+        if self.cache is not None:
+            self.hash ^= swap_hash(self.rows, i, j)
+        self._swap(i, j)
+        if not self.load_swaps:
+            self.cost = self._simulate(min(i, j) // self.stride, record=True)
+
+    def _move(self, move):
+        self.moves.apply(self.times, move)
+        self.moves.apply(self.rows, move)
+        if self.releases is not None:
+            self.moves.apply(self.releases, move)
+
+    def _shift_loads(self, loads, lo, hi, sign):
+        for position in range(lo, hi):
+            loads[position % self.machines] += sign * self.times[position]
+
+    def move_cost(self, move):
+        if self.swaps:
+            return self.swap_cost(*move)
+        lo, hi = self.moves.span(move)
+        if self.load_swaps:
+            loads = list(self.loads)
+            self._shift_loads(loads, lo, hi, -1)
+            self._move(move)
+            self._shift_loads(loads, lo, hi, 1)
+            self._move(self.moves.inverse(move))
+            return max(loads)
+        if self.cache is not None:
+            key = self.hash ^ span_hash(self.rows, lo, hi)
+        self._move(move)
+        cost = None
+        if self.cache is not None:
+            key ^= span_hash(self.rows, lo, hi)
+            cost = self.cache.get(key)
+        if cost is None:
+            cost = self._simulate(lo // self.stride)
+            if self.cache is not None:
+                self.cache.put(key, cost)
+        self._move(self.moves.inverse(move))
+        return cost
+
+    def make_move(self, move, cost=None):
+        if self.swaps:
+            self.apply_swap(*move)
+            return
+        lo, hi = self.moves.span(move)
+        if self.load_swaps:
+            self._shift_loads(self.loads, lo, hi, -1)
+        if self.cache is not None:
+            self.hash ^= span_hash(self.rows, lo, hi)
+        self._move(move)
+        if self.cache is not None:
+            self.hash ^= span_hash(self.rows, lo, hi)
+        if self.load_swaps:
+            self._shift_loads(self.loads, lo, hi, 1)
+            self.cost = max(self.loads)
+        else:
+            self.cost = self._simulate(lo // self.stride, record=True)
+
+    def score_moves(self, moves):
+        return [self.move_cost(move) for move in moves]
+
+    def propose(self):
+        move = next(self.stream)
+        return move, self.move_cost(move)
+
+    def apply(self, move, cost):
+        self.make_move(move, cost)
+
+class SearchProgress:
+    #Lets another thread follow a running search and stop it early. report() passes (fraction done, best objective)
+    #to callback at most every interval seconds; once stop_event is set the search returns the best solution so far.
+    def __init__(self, callback=None, stop_event=None, interval=0.1, offset=0.0, share=1.0):
+        self.callback = callback
+        self.stop_event = stop_event
+        self.interval = interval
+        self.offset = offset
+        self.share = share
+        self.last_report = 0.0
+
+    def stopped(self):
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def report(self, fraction, best, force=False):
+        now = time.perf_counter()
+        if self.callback is not None and (force or now - self.last_report >= self.interval):
+            self.last_report = now
+            self.callback(self.offset + self.share * min(fraction, 1.0), best)
+
+    def part(self, index, count):
+        #Progress of the index-th of count equal steps, e.g. one dispatching-rule start of find_best_solution.
+        return SearchProgress(self.callback, self.stop_event, self.interval, self.offset + self.share * index / count, self.share / count)
+
+class SearchStats:
+    #Opt-in instrumentation of a run: evaluations, seconds per phase (dispatching, evaluation, acceptance, rendering)
+    #and a best/current objective trace for every start. trace_every keeps one point in that many evaluations.
+    def __init__(self, trace_every=1, profile=False):
+        self.trace_every = trace_every
+        self.evaluations = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.seconds = 0.0
+        self.phases = {}
+        self.traces = {}
+        self.profiler = None
+        if profile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+
+    def add(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def timed(self, phase):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - started)
+
+    @contextlib.contextmanager
+    def running(self):
+        #Wall-clock time of the whole run, profiled with cProfile when profile=True.
+        if self.profiler is not None:
+            self.profiler.enable()
+        started = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.seconds += time.perf_counter() - started
+            if self.profiler is not None:
+                self.profiler.disable()
+
+    def trace(self, start):
+        return self.traces.setdefault(start, {"evaluation": [], "best": [], "current": []})
+
+    def count_cache(self, cache):
+        #Lookups of an EvaluationCache once its search is done.
+        self.cache_hits += cache.hits
+        self.cache_misses += cache.misses
+
+    def merge(self, other):
+        #Folds in the stats of a search start that ran in another process.
+        self.evaluations += other.evaluations
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        for phase, seconds in other.phases.items():
+            self.add(phase, seconds)
+        for start, trace in other.traces.items():
+            for name, values in trace.items():
+                self.trace(start)[name].extend(values)
+
+    def summary(self):
+        seconds = self.seconds or sum(self.phases.values())
+        evaluation_seconds = self.phases.get("evaluation", 0.0)
+        return {"evaluations": self.evaluations,
+                "seconds": seconds,
+                "evaluations_per_second": self.evaluations / seconds if seconds else None,
+                "evaluator_evaluations_per_second": self.evaluations / evaluation_seconds if evaluation_seconds else None,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "phases": dict(self.phases)}
+
+    def profile_report(self, limit=30):
+        import pstats
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue()
+
+    def to_json(self, path=None):
+        text = json.dumps({**self.summary(), "traces": self.traces}, default=float)
+        if path:
+            with open(path, "w") as file:
+                file.write(text)
+        return text
+
+def timed(stats, phase):
+    return stats.timed(phase) if stats is not None else contextlib.nullcontext()
+
+#Cooling schedules for anneal: start() is called once with the initial temperature, then update() after
+#every evaluation with the budget fraction used so far and the number of evaluations since the last new best.
+class GeometricCooling:
+    def __init__(self, alpha=None, final_ratio=1e-3):
+        self.alpha = alpha
+        self.final_ratio = final_ratio
+
+    def start(self, initial_temperature):
+        self.initial_temperature = initial_temperature
+        self.base_temperature = initial_temperature
+        self.base_progress = 0.0
+
+    def update(self, temperature, progress, stalled):
+        #Without a fixed alpha the decay is spread over the remaining budget and ends at final_ratio * T0.
+        if self.alpha is not None:
+            return temperature * self.alpha
+        remaining = max(1.0 - self.base_progress, 1e-12)
+        return self.base_temperature * self.final_ratio ** ((progress - self.base_progress) / remaining)
+
+class LinearCooling:
+    def start(self, initial_temperature):
+        self.initial_temperature = initial_temperature
+
+    def update(self, temperature, progress, stalled):
+        return self.initial_temperature * max(0.0, 1.0 - progress)
+
+class ReheatingCooling(GeometricCooling):
+    #Geometric cooling that heats back up to reheat_ratio * T0 after every patience evaluations without a new best.
+    def __init__(self, alpha=None, final_ratio=1e-3, patience=200, reheat_ratio=0.5):
+        super().__init__(alpha, final_ratio)
+        self.patience = patience
+        self.reheat_ratio = reheat_ratio
+
+    def update(self, temperature, progress, stalled):
+        if stalled and stalled % self.patience == 0:
+            self.base_temperature = max(temperature, self.initial_temperature * self.reheat_ratio)
+            self.base_progress = progress
+            return self.base_temperature
+        return super().update(temperature, progress, stalled)
+
+#Cooling schedules by the names the command line uses.
+COOLING_SCHEDULES = {"Geometric": GeometricCooling, "Linear": LinearCooling, "Reheating": ReheatingCooling}
+
+def check_budget(max_evaluations, time_limit, stagnation_limit):
+    #A search without an evaluation budget (None) needs another way to stop.
+    if max_evaluations is None and time_limit is None and stagnation_limit is None:
+        raise ValueError("The search needs an evaluation budget, a time limit or a stagnation limit.")
+
+def anneal(state, initial_temperature, cooling=None, acceptance="Metropolis", max_evaluations=500, time_limit=None, stagnation_limit=None,
+           progress=None, stats=None, label="Search"):
+    #Generic simulated annealing / threshold accepting over a state with rows, cost, moves, rng, propose() and apply().
+    #The search stops at the evaluation budget, the time budget or after stagnation_limit evaluations without a new best.
+    check_budget(max_evaluations, time_limit, stagnation_limit)
+    if not state.moves.size(len(state.rows)):
+        return state.rows.copy(), state.cost, 0
+    cooling = cooling if cooling is not None else GeometricCooling()
+    cooling.start(initial_temperature)
+    temperature = initial_temperature
+    best_rows = state.rows.copy()
+    best_cost = current_cost = state.cost
+    evaluations = 0
+    stalled = 0
+    evaluation_seconds = 0.0
+    trace = stats.trace(label) if stats is not None else None
+    uniforms = uniform_stream(state.rng)
+    started = time.perf_counter()
+    while True:
+        elapsed = time.perf_counter() - started
+        if max_evaluations is not None and evaluations >= max_evaluations:
+            break
+        if time_limit is not None and elapsed >= time_limit:
+            break
+        if stagnation_limit is not None and stalled >= stagnation_limit:
+            break
+        if progress is not None and progress.stopped():
+            break
+
+        if stats is not None:
+            tick = time.perf_counter()
+        move, cost = state.propose()
+        if stats is not None:
+            evaluation_seconds += time.perf_counter() - tick
+        evaluations += 1
+        delta = cost - current_cost
+        if acceptance == "Threshold":
+            accepted = delta < temperature or delta < 0
+        else:
+            accepted = delta <= 0 or (temperature > 0 and next(uniforms) < math.exp(-delta / temperature))
+        if accepted:
+            if stats is not None:
+                tick = time.perf_counter()
+            state.apply(move, cost)
+            if stats is not None:
+                evaluation_seconds += time.perf_counter() - tick
+            current_cost = cost
+        if cost < best_cost:
+            best_rows = state.rows.copy()
+            best_cost = cost
+            stalled = 0
+        else:
+            stalled += 1
+
+        used = 0.0
+        if max_evaluations is not None:
+            used = evaluations / max_evaluations
+        if time_limit is not None:
+            used = max(used, elapsed / time_limit)
+        temperature = cooling.update(temperature, min(used, 1.0), stalled)
+        if progress is not None:
+            progress.report(used if max_evaluations is not None or time_limit is not None else stalled / stagnation_limit, best_cost)
+        if trace is not None and evaluations % stats.trace_every == 0:
+            trace["evaluation"].append(evaluations)
+            trace["best"].append(best_cost)
+            trace["current"].append(current_cost)
+    if stats is not None:
+        #Scoring and applying moves is evaluator time; the rest of the loop is acceptance and bookkeeping.
+        stats.evaluations += evaluations
+        stats.add("evaluation", evaluation_seconds)
+        stats.add("acceptance", time.perf_counter() - started - evaluation_seconds)
+    return best_rows, best_cost, evaluations
+
+def descend(state, strategy="First Improvement", max_evaluations=500, time_limit=None, progress=None, stats=None, label="Search"):
+    #Systematic local search over a state with rows, cost, moves, rng, batch, score_moves() and make_move(). Each pass scans
+    #the neighborhood of the current sequence in a random order, state.batch moves at a time, and takes the first
+    #improving move or, for "Best Improvement", the best one of the pass. Stops at a local optimum or a budget.
+    if strategy not in STRATEGIES[1:]:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    evaluations = 0
+    trace = stats.trace(label) if stats is not None else None
+    started = time.perf_counter()
+    stopped = False
+    improved = True
+    while improved and not stopped:
+        improved = False
+        best_move = None
+        best_cost = state.cost
+        scan = state.moves.scan(len(state.rows), state.rng)
+        while True:
+            if max_evaluations is not None and evaluations >= max_evaluations:
+                stopped = True
+            if time_limit is not None and time.perf_counter() - started >= time_limit:
+                stopped = True
+            if progress is not None and progress.stopped():
+                stopped = True
+            size = state.batch if max_evaluations is None else min(state.batch, max_evaluations - evaluations)
+            moves = [] if stopped else list(itertools.islice(scan, size))
+            if not moves:
+                break
+            with timed(stats, "evaluation"):
+                costs = state.score_moves(moves)
+            evaluations += len(moves)
+            k = min(range(len(costs)), key=costs.__getitem__)
+            if costs[k] < best_cost:
+                best_move, best_cost = moves[k], costs[k]
+            if progress is not None:
+                progress.report(evaluations / max_evaluations if max_evaluations is not None else 0.0, min(best_cost, state.cost))
+            if trace is not None:
+                trace["evaluation"].append(evaluations)
+                trace["best"].append(min(best_cost, state.cost))
+                trace["current"].append(costs[k])
+            if best_move is not None and strategy == "First Improvement":
+                break
+        if best_move is not None:
+            with timed(stats, "evaluation"):
+                state.make_move(best_move, best_cost)
+            improved = True
+    if stats is not None:
+        stats.evaluations += evaluations
+    return state.rows.copy(), state.cost, evaluations
+
+#The searches minimize `objective` (see objective_weights) and return its value in place of the makespan.
+#neighborhood names the move (see NEIGHBORHOODS); strategy applies to the plain local search.
+#rng is a NumPy Generator (or a seed) for the search's random choices; see search_rng.
+def local_search(jobs, rule, machines, num_neighborhood,initial_sequence, method,iterations=500, initial_threshold=0,
+                 cooling=None, time_limit=None, stagnation_limit=None, objective="Makespan", progress=None, cache=None, stats=None,
+                 neighborhood="Swap", strategy="Random", rng=None):
+    table = build_job_table(jobs)
+    with timed(stats, "evaluation"):
+        current = ParallelSwapEvaluator(table, sequence_to_rows(table, initial_sequence), machines, rule, objective, cache=cache,
+                                        neighborhood=neighborhood, rng=rng)
+
+    if method == "Meta-Heuristic":
+        best_rows, best_makespan, evaluations = anneal(current, initial_threshold, cooling, max_evaluations=iterations,
+                                                       time_limit=time_limit, stagnation_limit=stagnation_limit, progress=progress,
+                                                       stats=stats, label=rule)
+        num_neighborhood += evaluations
+    elif strategy != "Random":
+        best_rows, best_makespan, evaluations = descend(current, strategy, max_evaluations=iterations, time_limit=time_limit,
+                                                        progress=progress, stats=stats, label=rule)
+        num_neighborhood += evaluations
+    else:
+        #Plain local search samples moves around the initial sequence and keeps the best one.
+        check_budget(iterations, time_limit, stagnation_limit)
+        best_rows = current.rows.copy()
+        best_makespan = current.cost
+        trace = stats.trace(rule) if stats is not None else None
+        started = time.perf_counter()
+        iteration = stalled = 0
+        has_moves = current.moves.size(len(best_rows)) > 0
+        while has_moves and (stagnation_limit is None or stalled < stagnation_limit):
+            used = _search_budget(started, iteration, iterations, time_limit, progress)
+            if used is None:
+                break
+            if progress is not None:
+                progress.report(used, best_makespan)
+            move = next(current.stream)
+            num_neighborhood += 1
+            iteration += 1
+            with timed(stats, "evaluation"):
+                new_makespan = current.move_cost(move)
+            if new_makespan < best_makespan:
+                best_rows = current.rows.copy()
+                current.moves.apply(best_rows, move)
+                best_makespan = new_makespan
+                stalled = 0
+            else:
+                stalled += 1
+            if trace is not None:
+                stats.evaluations += 1
+                if iteration % stats.trace_every == 0:
+                    trace["evaluation"].append(iteration)
+                    trace["best"].append(best_makespan)
+                    trace["current"].append(new_makespan)
+
+    best_schedule = build_schedule(table, best_rows, machines, rule=rule)
+    return rows_to_sequence(table, best_rows), best_makespan, best_schedule,num_neighborhood
+
+def find_best_solution(jobs, machines,method,threshold=0, iterations=500, cooling=None, time_limit=None, stagnation_limit=None, objective="Makespan",
+                       progress=None, cache_size=0, stats=None, neighborhood="Swap", strategy="Random", rng=None):
+    table = build_job_table(jobs)
+    cache = EvaluationCache(cache_size) if cache_size else None
+    rules = feasible_rules(table, machines, ["SPT", "LPT", "Wrap-Around"])
+    #One child stream per start, so adding or dropping a rule leaves the other searches unchanged.
+    streams = search_rng(rng).spawn(len(rules))
+    best_overall_makespan = float('inf')
+    best_overall_sequence = None
+    sequences_rules = {}
+    num_neighborhood = 0
+    
+    for k, rule in enumerate(rules):
+        with timed(stats, "dispatching"):
+            initial_sequence = apply_dispatching_rule(table, rule)
+        seq_name = "Initial_sequence_"+rule
+        sequences_rules[seq_name] = initial_sequence
+
+        best_sequence, best_makespan, best_schedule,num_neighborhood = local_search(
+            table, rule, machines, num_neighborhood,initial_sequence, method,iterations=iterations, initial_threshold=threshold,
+            cooling=cooling, time_limit=time_limit, stagnation_limit=stagnation_limit, objective=objective,
+            progress=progress.part(k, len(rules)) if progress is not None else None, cache=cache, stats=stats,
+            neighborhood=neighborhood, strategy=strategy, rng=streams[k]
+        )
+
+        if best_makespan < best_overall_makespan:
+            best_overall_sequence = best_sequence
+            best_overall_makespan = best_makespan
+            best_overall_schedule = best_schedule
+        if progress is not None and progress.stopped():
+            break
+    print(f"Number of neighborhood structures is {num_neighborhood}")
+    if cache is not None and stats is not None:
+        stats.count_cache(cache)
+    return best_overall_sequence, best_overall_schedule, sequences_rules
+
+
+#Exact single machine solvers. They assume every job is released at time 0; the searches above handle release dates.
+
+def moore_hodgson_rows(table):
+    #Fewest late jobs: add jobs in EDD order and whenever the last one is late drop the longest job kept so far.
+    #The on-time jobs stay in EDD order and the late ones follow.
+    kept = []
+    late = []
+    time_used = 0
+    for row in dispatching_rows(table, "EDD").tolist():
+        heapq.heappush(kept, (-table.process_time[row], row))
+        time_used += table.process_time[row]
+        if time_used > table.due_date[row]:
+            longest, dropped = heapq.heappop(kept)
+            time_used += longest
+            late.append(dropped)
+    on_time = sorted((row for _, row in kept), key=lambda row: (table.due_date[row], row))
+    return np.array(on_time + sorted(late, key=lambda row: (table.due_date[row], row)), dtype=np.intp)
+
+def weighted_late_rows(table):
+    #Lawler and Moore's dynamic program for the weighted number of late jobs: in EDD order, best[t] is the largest
+    #on-time weight whose jobs take exactly t time units. Pseudo-polynomial, so it needs integer times and due dates.
+    if not (np.issubdtype(table.process_time.dtype, np.integer) and np.issubdtype(table.due_date.dtype, np.integer)):
+        raise ValueError("The weighted late jobs program needs integer process times and due dates.")
+    order = dispatching_rows(table, "EDD")
+    capacity = int(max(0, min(table.process_time.sum(), table.due_date.max())))
+    best = np.full(capacity + 1, -np.inf)
+    best[0] = 0
+    taken = np.zeros((len(order), capacity + 1), dtype=bool)
+    for k, row in enumerate(order.tolist()):
+        duration, due = int(table.process_time[row]), min(int(table.due_date[row]), capacity)
+        if duration > due:
+            continue
+        with_job = best[:due + 1 - duration] + table.weight[row]
+        better = with_job > best[duration:due + 1]
+        best[duration:due + 1][better] = with_job[better]
+        taken[k, duration:due + 1] = better
+    on_time = []
+    time_used = int(np.argmax(best))
+    for k in range(len(order) - 1, -1, -1):
+        if taken[k, time_used]:
+            on_time.append(order[k])
+            time_used -= int(table.process_time[order[k]])
+    on_time_rows = set(on_time)
+    return np.array(on_time[::-1] + [row for row in order.tolist() if row not in on_time_rows], dtype=np.intp)
+
+def emmons_precedence(table, factor, closure_limit=256):
+    #Emmons' first rule with weights (Rinnooy Kan, Lageweg and Lenstra): some optimal sequence puts i before j when
+    #p_i <= p_j, w_i >= w_j and d_i <= max(d_j, p(B_j) + p_j), B_j the jobs already known to come before j. Returns
+    #the (jobs x jobs) matrix of known precedences. Identical jobs are ordered by due date and then row; up to
+    #closure_limit jobs the rule is repeated with B_j grown to every known (transitive) predecessor.
+    times = table.process_time.astype(np.float64)
+    due = table.due_date.astype(np.float64)
+    factor = np.asarray(factor, dtype=np.float64)
+    count = len(times)
+    rows = np.arange(count)
+    same = (times[:, None] == times[None, :]) & (factor[:, None] == factor[None, :])
+    later = (due[:, None] > due[None, :]) | (due[:, None] == due[None, :]) & (rows[:, None] > rows[None, :])
+    candidates = (times[:, None] <= times[None, :]) & (factor[:, None] >= factor[None, :]) & ~(same & later) & (rows[:, None] != rows[None, :])
+    before = np.zeros((count, count), dtype=bool)
+    while True:
+        known = before
+        if count <= closure_limit:
+            #Transitive closure by repeated squaring.
+            while True:
+                grown = known | (known.astype(np.float64) @ known.astype(np.float64) > 0)
+                if (grown == known).all():
+                    break
+                known = grown
+        preceding = times @ known
+        found = candidates & (due[:, None] <= np.maximum(due[None, :], preceding[None, :] + times[None, :]))
+        if (found == before).all() or count > closure_limit:
+            return found
+        before = found
+
+def tardiness_branch_and_bound(table, objective="Total weighted tardiness (WjTj)", time_limit=None, progress=None, memo_limit=1 << 20, rng=None,
+                               max_levels=32, multiplier_steps=100):
+    #Total (weighted) tardiness by depth-first branch and bound that fixes the sequence from the back: the last of the
+    #unscheduled jobs S ends at p(S), so its tardiness is known. A node is cut when
+    # - its cost plus a lower bound on S reaches the incumbent,
+    # - its job has a successor left in S by emmons_precedence,
+    # - swapping its job with the one placed right after it would be strictly cheaper,
+    # - S was reached before with no more cost placed after it (memoization, up to memo_limit sets).
+    #A job that is on time even at p(S) is put last straight away. Returns (rows, cost, lower bound, proven optimal);
+    #on the time limit or a cancel the incumbent comes back with the lowest bound of the nodes still open (the one
+    #being entered and the unexplored siblings along the current path), each raised to the best bound above it.
+    weights = objective_weights(objective)
+    if weights[[0, 1, 3, 4, 5]].any():
+        raise ValueError("Branch and bound only handles total tardiness and total weighted tardiness.")
+    count = len(table.job_numbers)
+    if not count:
+        return np.array([], dtype=np.intp), 0, 0, True
+    times = table.process_time.tolist()
+    due = table.due_date.tolist()
+    factor = (weights[2] + weights[6] * table.weight).tolist()
+    #A job with a known successor still unscheduled is never placed last.
+    successors = [sum(1 << other for other in np.flatnonzero(after).tolist()) for after in emmons_precedence(table, factor)]
+    process_time = table.process_time.astype(np.float64)
+    due_date = table.due_date.astype(np.float64)
+    factors = np.array(factor, dtype=np.float64)
+    spt = np.argsort(process_time, kind="stable")
+    edd = np.argsort(due_date, kind="stable")
+    spt_times, edd_due = process_time[spt], due_date[edd]
+    beyond = 2 * process_time.sum() + 1
+    present = np.ones(count, dtype=bool)
+
+    def split_bound(multipliers):
+        #A bound over the unscheduled jobs (present) from sum f_j T_j >= sum u_j T_j + sum (f_j - u_j) T_j, 0 <= u <= f:
+        # - sum u_j T_j >= sum u_j (C_j - d_j), least in WSPT order of u,
+        # - for each value v of f - u (v' the value below), (v - v') times sum max(0, C_k - d_k) over the jobs with
+        #   f - u at least v, SPT completions against EDD due dates. Leaving jobs out only makes the others finish
+        #   earlier, so every level bounds the tardiness of its own jobs.
+        #f - u is rounded down onto at most max_levels values.
+        rest = factors - multipliers
+        levels = np.unique(rest[rest > 0])
+        if len(levels) > max_levels:
+            levels = np.unique(np.quantile(levels, np.linspace(0, 1, max_levels)))
+        steps = np.diff(levels, prepend=0)
+        level_spt = rest[spt] >= levels[:, None]
+        level_edd = rest[edd] >= levels[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            order = np.argsort(process_time / multipliers, kind="stable")
+        order_times, order_due, order_multipliers = process_time[order], due_date[order], multipliers[order]
+
+        def lower_bound():
+            members = present[order]
+            linear = (order_multipliers * members) @ ((order_times * members).cumsum() - order_due)
+            members = level_spt & present[spt]
+            completion = np.where(members, (spt_times * members).cumsum(axis=1), beyond)
+            completion.sort(axis=1)
+            dues = np.where(level_edd & present[edd], edd_due, beyond)
+            dues.sort(axis=1)
+            completion -= dues
+            return float(max(linear, 0) + steps @ np.maximum(completion, 0, out=completion).sum(axis=1))
+
+        return lower_bound, order
+
+    #u is picked at the root by a sign subgradient ascent on the first part, from u = 0, f / 2 and f, keeping the u
+    #with the best whole bound.
+    lower_bound, root_bound = None, -math.inf
+    for start in (0, 0.5, 1):
+        multipliers = start * factors
+        for step in range(multiplier_steps):
+            bound, order = split_bound(multipliers)
+            if bound() > root_bound:
+                lower_bound, root_bound = bound, bound()
+            slope = np.empty(count)
+            slope[order] = np.cumsum(process_time[order]) - due_date[order]
+            multipliers = np.clip(multipliers + 0.3 * factors.max() / math.sqrt(step + 1) * np.sign(slope), 0, factors)
+
+    def sequence_cost(rows):
+        completion = np.cumsum(table.process_time[rows])
+        return sum(factor[row] * max(0, end - due[row]) for row, end in zip(rows.tolist(), completion.tolist()))
+
+    #The incumbent is the best dispatching rule after a first-improvement insertion descent.
+    start_rows = min((dispatching_rows(table, rule) for rule in ("EDD", "WSPT", "SPT")), key=sequence_cost)
+    if count > 1:
+        state = ParallelSwapEvaluator(table, start_rows, 1, "SPT", objective, neighborhood="Insertion", rng=rng)
+        start_rows = descend(state, "First Improvement", max_evaluations=50 * count * count)[0]
+    best = {"rows": start_rows, "cost": sequence_cost(start_rows)}
+    everything = (1 << count) - 1
+    memo = {}
+    suffix = []
+    open_bounds = []
+    nodes = 0
+    started = time.perf_counter()
+    stopped = False
+
+    def search(members, finish, placed_cost, next_row, floor):
+        #floor: the largest bound along the path here, which holds for everything below it too.
+        nonlocal nodes, stopped
+        nodes += 1
+        if nodes % 1024 == 0:
+            if (time_limit is not None and time.perf_counter() - started >= time_limit) or (progress is not None and progress.stopped()):
+                stopped = True
+            elif progress is not None:
+                progress.report((time.perf_counter() - started) / time_limit if time_limit else 0.0, best["cost"])
+        if stopped:
+            open_bounds.append(max(floor, placed_cost + lower_bound()))
+            return
+        if not members:
+            if placed_cost < best["cost"]:
+                best["rows"] = np.array(suffix[::-1], dtype=np.intp)
+                best["cost"] = placed_cost
+            return
+        seen = memo.get(members)
+        if seen is not None and seen <= placed_cost:
+            return
+        if seen is not None or len(memo) < memo_limit:
+            memo[members] = placed_cost
+        floor = max(floor, placed_cost + lower_bound())
+        if floor >= best["cost"]:
+            return
+        rows = [row for row in range(count) if members >> row & 1 and not successors[row] & members]
+        on_time = [row for row in rows if due[row] >= finish]
+        if on_time:
+            rows = [max(on_time, key=lambda row: (due[row], row))]
+        rows.sort(key=lambda row: (factor[row] * max(0, finish - due[row]), -due[row]))
+        children = []
+        for row in rows:
+            cost = factor[row] * max(0, finish - due[row])
+            if next_row is not None:
+                after = finish + times[next_row]
+                swapped = factor[next_row] * max(0, finish - times[row] + times[next_row] - due[next_row]) + factor[row] * max(0, after - due[row])
+                if swapped < cost + factor[next_row] * max(0, after - due[next_row]):
+                    continue
+            children.append((row, cost))
+        for k, (row, cost) in enumerate(children):
+            suffix.append(row)
+            present[row] = False
+            search(members & ~(1 << row), finish - times[row], placed_cost + cost, row, floor)
+            if stopped:
+                for row, cost in children[k + 1:]:
+                    present[row] = False
+                    open_bounds.append(max(floor, placed_cost + cost + lower_bound()))
+                    present[row] = True
+            present[suffix.pop()] = True
+            if stopped:
+                return
+
+    search(everything, sum(times), 0, None, 0)
+    if stopped:
+        return best["rows"], best["cost"], min(open_bounds + [best["cost"]]), False
+    return best["rows"], best["cost"], best["cost"], True
+
+def exact_single_machine_rows(table, objective, time_limit=None, progress=None, rng=None):
+    #Optimal sequence of one machine for a single objective: (rows, lower bound, proven optimal).
+    if table.release_date.any():
+        raise ValueError("The exact solvers assume every job is released at time 0.")
+    if objective in ("Makespan", "Total completion time"):
+        return dispatching_rows(table, "SPT"), None, True
+    if objective == "Total weighted completion":
+        return dispatching_rows(table, "WSPT"), None, True
+    if objective == "Total lateness (Uj)":
+        return moore_hodgson_rows(table), None, True
+    if objective == "Total weighted lateness (WjUj)":
+        return weighted_late_rows(table), None, True
+    if objective in ("Total tardiness", "Total weighted tardiness (WjTj)"):
+        rows, _, lower_bound, proven = tardiness_branch_and_bound(table, objective, time_limit, progress, rng=rng)
+        return rows, lower_bound, proven
+    raise ValueError(f"No exact solver for: {objective}")
+
+
+#flowshop scheduling
+
+def flowshop_stage_times(table, machines):
+    #The (jobs x machines) processing times: the instance's own matrix, or process_time repeated on every machine.
+    if table.stage_times.shape[1]:
+        if table.stage_times.shape[1] != machines:
+            raise ValueError(f"The instance has process times for {table.stage_times.shape[1]} machines, not {machines}.")
+        return table.stage_times
+    return np.broadcast_to(table.process_time[:, None], (len(table.process_time), machines))
+
+def flowshop_cumulative_times(stage_times):
+    inclusive = np.cumsum(stage_times, axis=1)
+    return inclusive, inclusive - stage_times
+
+def flowshop_makespans(cumulative_times, candidates, return_completion=False):
+    #C[i][m] = max(C[i-1][m], C[i][m-1]) + p[i][m] unrolls to a running maximum over machines,
+    #so each job is one step over a (candidates x machines) array instead of a double loop.
+    #return_completion=True adds the (candidates x jobs x machines) matrix, "last" only the last machine's column.
+    inclusive, exclusive = cumulative_times
+    candidates = np.atleast_2d(candidates)
+    num_candidates, num_jobs = candidates.shape
+    if return_completion is not True and num_candidates * inclusive.shape[1] <= 64:
+        return _flowshop_makespans_small(inclusive - exclusive, candidates, return_completion)
+    machine_times = np.zeros((num_candidates, inclusive.shape[1]), dtype=inclusive.dtype)
+    if return_completion == "last":
+        completion = np.empty((num_candidates, num_jobs), dtype=inclusive.dtype)
+    elif return_completion:
+        completion = np.empty((num_candidates, num_jobs, inclusive.shape[1]), dtype=inclusive.dtype)
+    for i in range(num_jobs):
+        job_rows = candidates[:, i]
+        machine_times = np.maximum.accumulate(machine_times - exclusive[job_rows], axis=1) + inclusive[job_rows]
+        if return_completion == "last":
+            completion[:, i] = machine_times[:, -1]
+        elif return_completion:
+            completion[:, i] = machine_times
+    if return_completion:
+        return machine_times[:, -1], completion
+    return machine_times[:, -1]
+
+def _flowshop_makespans_small(stage_times, candidates, return_completion):
+    #A handful of short candidates is faster as plain Python than as one NumPy call per job.
+    makespans = []
+    completion = []
+    for rows in candidates:
+        machine_times = [0] * stage_times.shape[1]
+        last = []
+        for times in stage_times[rows].tolist():
+            previous = 0
+            for m, duration in enumerate(times):
+                previous = (machine_times[m] if machine_times[m] > previous else previous) + duration
+                machine_times[m] = previous
+            last.append(previous)
+        makespans.append(machine_times[-1])
+        completion.append(last)
+    makespans = np.array(makespans, dtype=stage_times.dtype)
+    if return_completion:
+        return makespans, np.array(completion, dtype=stage_times.dtype).reshape(candidates.shape)
+    return makespans
+
+def flowshop_costs(cumulative_times, candidates, table, weights):
+    #Objective value of every candidate; the plain makespan when nothing else is weighted, like ParallelSwapEvaluator.
+    if not weights[1:].any():
+        return flowshop_makespans(cumulative_times, candidates)
+    candidates = np.atleast_2d(candidates)
+    makespans, completion = flowshop_makespans(cumulative_times, candidates, return_completion="last")
+    costs = job_costs(completion, table.due_date[candidates], table.weight[candidates], weights)
+    return weights[0] * makespans + costs.sum(axis=1)
+
+def flowshop_completion_from(machine_times, rows, free):
+    #Completion times (machines x len(rows)) of rows run in order on machines that are free from free[m] on;
+    #machine_times is the (machines x jobs) transpose of the stage times. Along the jobs of one machine the
+    #recurrence is C[i][m] = S[i] + max(free[m], max over k <= i of C[k][m-1] - S[k-1]), S the running sum of
+    #the times on m, so a single sequence costs one running maximum per machine rather than a step per job.
+    times = machine_times[:, rows]
+    sums = np.cumsum(times, axis=1)
+    before = sums - times
+    completion = np.empty_like(sums)
+    previous = np.zeros(times.shape[1], dtype=sums.dtype)
+    for machine in range(len(times)):
+        previous = sums[machine] + np.maximum.accumulate(np.maximum(previous - before[machine], free[machine]))
+        completion[machine] = previous
+    return completion
+
+def calculate_flowshop_completion_times(jobs, machines, sequence):
+    table = build_job_table(jobs)
+    schedule = build_schedule(table, sequence_to_rows(table, sequence), machines, "Flowshop")
+    return dict(zip(sequence, schedule['end'].reshape(-1, machines).tolist()))
+
+def apply_dispatching_rule_flowshop(jobs, rule):
+    if rule not in ("SPT", "LPT", "EDD", "WSPT"):
+        raise ValueError("Unknown rule")
+    return apply_dispatching_rule(jobs, rule)
+
+
+
+class FlowshopSwapEvaluator:
+    #Search state for anneal and descend. The scans of descend and the plain local search score whole blocks of
+    #neighbours with the batched recurrence. anneal takes one neighbour at a time and accepting one makes the rest
+    #of a block stale. Its blocks grow while neighbours are being rejected and shrink to twice the number used when
+    #one is accepted; a block costs one step per job, so a small block on a long sequence is instead scored one
+    #neighbour at a time, when it is handed out, from the heads and tails of the current sequence as in Taillard's
+    #insertion: a move changes positions lo .. hi - 1 only, so the machines are free from head[lo] on and the
+    #makespan is max(C[hi - 1] + tail[hi]), about one step per machine. With an EvaluationCache only neighbours
+    #that were not scored before go through the recurrence. Candidates are written into one preallocated
+    #(block_size x jobs) buffer and moves are applied to it in place.
+    #Steps of fixed cost per neighbour scored on its own, on top of one per machine.
+    span_overhead = 8
+
+    def __init__(self, table, cumulative_times, rows, objective="Makespan", block_size=64, cache=None, neighborhood="Swap", rng=None):
+        self.weights = objective_weights(objective)
+        self.makespan_only = not self.weights[1:].any()
+        self.moves = neighborhood_moves(neighborhood)
+        self.swaps = neighborhood == "Swap"
+        self.rng = search_rng(rng)
+        self.block_size = block_size
+        self.batch = block_size
+        self.cache = cache
+        self.reset(table, cumulative_times, rows)
+
+    def reset(self, table, cumulative_times, rows):
+        #Points the search at another instance or sequence (an edited instance of a SolverSession); the objective,
+        #the random stream and the cache stay.
+        self.table = table
+        self.cumulative_times = cumulative_times
+        self.rows = np.array(rows)
+        self.cost = self.score(self.rows)[0].item()
+        inclusive, exclusive = cumulative_times
+        self._times = np.ascontiguousarray((inclusive - exclusive).T)
+        self._reverse_times = np.ascontiguousarray(self._times[::-1])
+        self._heads = np.zeros((len(self._times), len(self.rows) + 1), dtype=self._times.dtype)
+        self._tails = np.zeros_like(self._heads)
+        self._stale = (0, len(self.rows))
+        if self.cache is not None:
+            self.hash = sequence_hash(self.rows)
+            self.cache.put(self.hash, self.cost)
+        self._buffer = np.empty((self.block_size, len(self.rows)), dtype=self.rows.dtype)
+        self._size = 1
+        self._block = None
+
+    def score(self, candidates):
+        return flowshop_costs(self.cumulative_times, candidates, self.table, self.weights)
+
+    def _changed(self, lo, hi):
+        #Positions lo .. hi - 1 of the current sequence changed; heads and tails are brought up to date only when
+        #propose() needs them, so descend pays nothing for them.
+        if self._stale is not None:
+            lo, hi = min(lo, self._stale[0]), max(hi, self._stale[1])
+        self._stale = (lo, hi)
+
+    def _refresh(self):
+        #Heads (machine free times before each position) from lo on and tails (longest path from each position to
+        #the end) up to hi.
+        lo, hi = self._stale
+        self._stale = None
+        self._heads[:, lo + 1:] = flowshop_completion_from(self._times, self.rows[lo:], self._heads[:, lo])
+        if hi > 0:
+            reverse = self._tails[::-1]
+            reverse[:, :hi] = flowshop_completion_from(self._reverse_times, self.rows[hi - 1::-1], reverse[:, hi])[:, ::-1]
+        if not self.makespan_only:
+            rows = self.rows
+            costs = job_costs(self._heads[-1, 1:], self.table.due_date[rows], self.table.weight[rows], self.weights)
+            self._prefix_costs = np.concatenate([[0.0], np.cumsum(costs)])
+
+    def _span_cost(self, candidate, lo, hi):
+        if self._stale is not None:
+            self._refresh()
+        if self.makespan_only:
+            ends = flowshop_completion_from(self._times, candidate[lo:hi], self._heads[:, lo])[:, -1]
+            return (ends + self._tails[:, hi]).max().item()
+        #The other objectives need every completion time after lo.
+        rows = candidate[lo:]
+        completion = flowshop_completion_from(self._times, rows, self._heads[:, lo])[-1]
+        costs = job_costs(completion, self.table.due_date[rows], self.table.weight[rows], self.weights)
+        return (self.weights[0] * completion[-1] + self._prefix_costs[lo] + costs.sum()).item()
+
+    def _candidate_cost(self, k):
+        #Cost of the k-th candidate of the last block, through the cache when there is one.
+        cost = self.cache.get(self._keys[k]) if self.cache is not None else None
+        if cost is None:
+            cost = self._span_cost(self._block[k], *self._span(k))
+            if self.cache is not None:
+                self.cache.put(self._keys[k], cost)
+        return cost
+
+    def _cached_costs(self, block):
+        costs = [self.cache.get(key) for key in self._keys]
+        missing = [k for k, cost in enumerate(costs) if cost is None]
+        if missing:
+            for k, cost in zip(missing, self.score(block[missing]).tolist()):
+                costs[k] = cost
+                self.cache.put(self._keys[k], cost)
+        return costs
+
+    def _span(self, k):
+        #Positions changed by the k-th candidate of the last block.
+        if self.swaps:
+            i, j = self._moves[k].tolist()
+            return min(i, j), max(i, j) + 1
+        return self.moves.span(self._moves[k])
+
+    def candidates(self, moves):
+        #The neighbours of the current sequence (rows of the shared buffer, valid until the next call); their
+        #moves and, with a cache, their hashes are kept for scoring.
+        if self.swaps:
+            pairs = np.array(moves).reshape(len(moves), 2)
+            block = swap_block(self.rows, pairs, self._buffer[:len(pairs)])
+            self._moves = pairs
+            if self.cache is not None:
+                self._keys = [self.hash ^ swap_hash(self.rows, i, j) for i, j in pairs.tolist()]
+            return block
+        block = self._buffer[:len(moves)]
+        block[:] = self.rows
+        for candidate, move in zip(block, moves):
+            self.moves.apply(candidate, move)
+        self._moves = moves
+        if self.cache is not None:
+            self._keys = [self.hash ^ span_hash(self.rows, lo, hi) ^ span_hash(candidate, lo, hi)
+                          for candidate, (lo, hi) in zip(block, map(self.moves.span, moves))]
+        return block
+
+    def random_moves(self, size):
+        if self.swaps:
+            return random_swap_pairs(len(self.rows), size, self.rng)
+        return self.moves.sample(len(self.rows), size, self.rng)
+
+    def neighbors(self, moves):
+        #The candidate sequences (see candidates) and their costs.
+        block = self.candidates(moves)
+        if self.cache is None:
+            return block, self.score(block).tolist()
+        return block, self._cached_costs(block)
+
+    def score_moves(self, moves):
+        return self.neighbors(moves)[1]
+
+    def make_move(self, move, cost):
+        lo, hi = self.moves.span(move)
+        if self.cache is not None:
+            self.hash ^= span_hash(self.rows, lo, hi)
+        self.moves.apply(self.rows, move)
+        if self.cache is not None:
+            self.hash ^= span_hash(self.rows, lo, hi)
+        self.cost = cost
+        self._changed(lo, hi)
+        self._block = None
+
+    def propose(self):
+        if self._block is None or self._next == len(self._block):
+            if self._block is not None:
+                self._size = min(self.block_size, 2 * self._size)
+            moves = self.random_moves(self._size)
+            if self._size * (len(self._times) + self.span_overhead) < len(self.rows):
+                self._block, self._costs = self.candidates(moves), None
+            else:
+                self._block, self._costs = self.neighbors(moves)
+            self._next = 0
+        self._next += 1
+        move = self._next - 1
+        return move, self._costs[move] if self._costs is not None else self._candidate_cost(move)
+
+    def apply(self, move, cost):
+        self.rows[:] = self._block[move]
+        self.cost = cost
+        self._changed(*self._span(move))
+        if self.cache is not None:
+            self.hash = self._keys[move]
+        self._size = min(self.block_size, 2 * (move + 1))
+        self._block = None
+
+def local_search_flowshop(jobs, rule, machines, num_neighborhood,initial_sequence, method, iterations=500, initial_threshold=0, block_size=64,
+                          cooling=None, time_limit=None, stagnation_limit=None, objective="Makespan", progress=None, cache=None, stats=None,
+                          neighborhood="Swap", strategy="Random", rng=None):
+    table = build_job_table(jobs)
+    with timed(stats, "evaluation"):
+        cumulative_times = flowshop_cumulative_times(flowshop_stage_times(table, machines))
+        current = FlowshopSwapEvaluator(table, cumulative_times, sequence_to_rows(table, initial_sequence), objective, block_size, cache,
+                                        neighborhood, rng)
+
+    if method == "Meta-Heuristic":
+        best_rows, best_makespan, evaluations = anneal(current, initial_threshold, cooling, max_evaluations=iterations,
+                                                       time_limit=time_limit, stagnation_limit=stagnation_limit, progress=progress,
+                                                       stats=stats, label=rule)
+        num_neighborhood += evaluations
+    elif strategy != "Random":
+        #The scans score block_size neighbours per call to the recurrence.
+        best_rows, best_makespan, evaluations = descend(current, strategy, max_evaluations=iterations, time_limit=time_limit,
+                                                        progress=progress, stats=stats, label=rule)
+        num_neighborhood += evaluations
+    else:
+        #Plain local search samples moves around the initial sequence, so whole blocks can be scored at once.
+        check_budget(iterations, time_limit, stagnation_limit)
+        best_rows = current.rows
+        best_makespan = current.cost
+        evaluated = stalled = 0
+        trace = stats.trace(rule) if stats is not None else None
+        started = time.perf_counter()
+        has_moves = current.moves.size(len(best_rows)) > 0
+        while has_moves and (stagnation_limit is None or stalled < stagnation_limit):
+            used = _search_budget(started, evaluated, iterations, time_limit, progress)
+            if used is None:
+                break
+            if progress is not None:
+                progress.report(used, best_makespan)
+            size = block_size if iterations is None else min(block_size, iterations - evaluated)
+            moves = current.random_moves(size)
+            with timed(stats, "evaluation"):
+                block, makespans = current.neighbors(moves)
+            makespans = np.asarray(makespans)
+            num_neighborhood += size
+            evaluated += size
+            k = int(np.argmin(makespans))
+            if makespans[k] < best_makespan:
+                best_rows = block[k].copy()
+                best_makespan = makespans[k].item()
+                stalled = 0
+            else:
+                stalled += size
+            if trace is not None:
+                #One point per scored block: its best neighbour stands in for the current objective.
+                stats.evaluations += size
+                trace["evaluation"].append(evaluated)
+                trace["best"].append(best_makespan)
+                trace["current"].append(makespans[k].item())
+
+    best_schedule = build_schedule(table, best_rows, machines, "Flowshop")
+    return rows_to_sequence(table, best_rows), best_makespan, best_schedule,num_neighborhood
+
+def taillard_insertion_makespans(cumulative_times, reverse_cumulative_times, rows, job_row):
+    #Taillard's acceleration: heads e (completion up to each job), tails q (time from each job to the end)
+    #and f (the inserted job after each head) give the makespan of every insertion position in O(n*m).
+    inclusive, exclusive = cumulative_times
+    heads = np.zeros((len(rows) + 1, inclusive.shape[1]), dtype=inclusive.dtype)
+    tails = np.zeros_like(heads)
+    if len(rows):
+        heads[1:] = flowshop_makespans(cumulative_times, rows, return_completion=True)[1][0]
+        tails[:-1] = flowshop_makespans(reverse_cumulative_times, rows[::-1], return_completion=True)[1][0][::-1, ::-1]
+    inserted = np.maximum.accumulate(heads - exclusive[job_row], axis=1) + inclusive[job_row]
+    return (inserted + tails).max(axis=1)
+
+def neh_rows(stage_times, cumulative_times, reverse_cumulative_times, progress=None):
+    order = np.argsort(-stage_times.sum(axis=1), kind='stable')
+    rows = order[:1]
+    for k, job_row in enumerate(order[1:], start=1):
+        if progress is not None:
+            if progress.stopped():
+                #Cancelled: the jobs not inserted yet keep their NEH order at the end.
+                return np.concatenate([rows, order[k:]])
+            progress.report(k / len(order), None)
+        makespans = taillard_insertion_makespans(cumulative_times, reverse_cumulative_times, rows, job_row)
+        rows = np.insert(rows, int(np.argmin(makespans)), job_row)
+    return rows
+
+def neh_sequence(jobs, machines, progress=None):
+    table = build_job_table(jobs)
+    stage_times = flowshop_stage_times(table, machines)
+    rows = neh_rows(stage_times, flowshop_cumulative_times(stage_times), flowshop_cumulative_times(stage_times[:, ::-1]), progress)
+    return rows_to_sequence(table, rows)
+
+def insertion_candidates(rows, job_row, positions=None):
+    #Row k of the result is rows with job_row inserted at positions[k] (by default every position in turn).
+    columns = np.arange(len(rows) + 1)
+    positions = columns if positions is None else np.asarray(positions)
+    source = np.where(columns[None, :] < positions[:, None], columns[None, :], columns[None, :] - 1)
+    source[np.arange(len(positions)), positions] = len(rows)
+    return np.append(rows, job_row)[source]
+
+def local_search_flowshop_insertion(jobs, machines, num_neighborhood, initial_sequence, iterations=500, objective="Makespan", progress=None,
+                                    stats=None, rng=None):
+    table = build_job_table(jobs)
+    rng = search_rng(rng)
+    stage_times = flowshop_stage_times(table, machines)
+    cumulative_times = flowshop_cumulative_times(stage_times)
+    reverse_cumulative_times = flowshop_cumulative_times(stage_times[:, ::-1])
+    weights = objective_weights(objective)
+    best_rows = sequence_to_rows(table, initial_sequence)
+    best_makespan = flowshop_costs(cumulative_times, best_rows, table, weights)[0]
+
+    #Each iteration removes one job and reinserts it at its best position; stop at a local optimum.
+    scans = 0
+    evaluated = 0
+    trace = stats.trace("NEH") if stats is not None else None
+    improved = True
+    #Without an iteration budget the passes run to the local optimum.
+    limit = iterations if iterations is not None else math.inf
+    while improved and scans < limit:
+        improved = False
+        for job_row in rng.permutation(best_rows).tolist():
+            if scans >= limit or (progress is not None and progress.stopped()):
+                improved = False
+                break
+            if progress is not None:
+                progress.report(scans / limit, best_makespan)
+            scans += 1
+            remaining = best_rows[best_rows != job_row]
+            with timed(stats, "evaluation"):
+                if weights[1:].any():
+                    #Taillard's matrices only give makespans; other objectives score all insertions as one batch.
+                    makespans = flowshop_costs(cumulative_times, insertion_candidates(remaining, job_row), table, weights)
+                else:
+                    makespans = taillard_insertion_makespans(cumulative_times, reverse_cumulative_times, remaining, job_row)
+            num_neighborhood += len(makespans)
+            evaluated += len(makespans)
+            position = int(np.argmin(makespans))
+            if makespans[position] < best_makespan:
+                best_rows = np.insert(remaining, position, job_row)
+                best_makespan = makespans[position]
+                improved = True
+            if trace is not None:
+                stats.evaluations += len(makespans)
+                trace["evaluation"].append(evaluated)
+                trace["best"].append(best_makespan.item())
+                trace["current"].append(makespans[position].item())
+
+    best_schedule = build_schedule(table, best_rows, machines, "Flowshop")
+    return rows_to_sequence(table, best_rows), best_makespan.item(), best_schedule,num_neighborhood
+
+def find_best_solution_flowshop(jobs, machines, method, threshold=0, iterations=500, cooling=None, time_limit=None, stagnation_limit=None,
+                                objective="Makespan", progress=None, cache_size=0, stats=None, neighborhood="Swap", strategy="Random", rng=None):
+    table = build_job_table(jobs)
+    cache = EvaluationCache(cache_size) if cache_size else None
+    rules = ["SPT", "LPT", "EDD"]
+    streams = search_rng(rng).spawn(len(rules))
+    best_overall_makespan = float('inf')
+    best_overall_sequence = None
+    sequences_rules = {}
+    num_neighborhood = 0
+
+    if method == "NEH Insertion":
+        with timed(stats, "dispatching"):
+            initial_sequence = neh_sequence(table, machines, progress.part(0, 2) if progress is not None else None)
+        sequences_rules["Initial_sequence_NEH"] = initial_sequence
+        best_overall_sequence, best_overall_makespan, best_overall_schedule, num_neighborhood = local_search_flowshop_insertion(
+            table, machines, num_neighborhood, initial_sequence, iterations=iterations, objective=objective,
+            progress=progress.part(1, 2) if progress is not None else None, stats=stats, rng=streams[0]
+        )
+        print(f"Number of neighborhood structures is {num_neighborhood}")
+        return best_overall_sequence, best_overall_schedule, sequences_rules
+
+    for k, rule in enumerate(rules):
+        with timed(stats, "dispatching"):
+            initial_sequence = apply_dispatching_rule_flowshop(table, rule)
+        seq_name = "Initial_sequence_" + rule
+        sequences_rules[seq_name] = initial_sequence
+        
+        best_sequence, best_makespan, best_schedule,num_neighborhood = local_search_flowshop(
+            table, rule, machines,num_neighborhood, initial_sequence, method, iterations=iterations, initial_threshold=threshold,
+            cooling=cooling, time_limit=time_limit, stagnation_limit=stagnation_limit, objective=objective,
+            progress=progress.part(k, len(rules)) if progress is not None else None, cache=cache, stats=stats,
+            neighborhood=neighborhood, strategy=strategy, rng=streams[k]
+        )
+
+        if best_makespan < best_overall_makespan:
+            best_overall_sequence = best_sequence
+            best_overall_makespan = best_makespan
+            best_overall_schedule = best_schedule
+        if progress is not None and progress.stopped():
+            break
+
+    print(f"Number of neighborhood structures is {num_neighborhood}")
+    if cache is not None and stats is not None:
+        stats.count_cache(cache)
+    return best_overall_sequence, best_overall_schedule, sequences_rules
+
+def calculate_objectives_flowshop(jobs, sequence, job_completion_times):
+    table = build_job_table(jobs)
+    completion = np.array([job_completion_times[job][-1] for job in sequence])
+    return objectives_from_arrays(table, sequence_to_rows(table, sequence), completion)
+
+
+#Multi-start search: every dispatching rule start and every random restart is an independent task.
+_worker_table = None
+_worker_stop = None
+
+def _init_search_worker(table, stop_event=None):
+    global _worker_table, _worker_stop
+    _worker_table = table
+    _worker_stop = stop_event
+
+def _run_search_start(task, progress=None):
+    problem, rule, machines, method, initial_rows, iterations, threshold, task_rng, options = task
+    table = _worker_table
+    if progress is None and _worker_stop is not None:
+        #In a worker process the caller's cancel reaches the search through the shared event.
+        progress = SearchProgress(stop_event=_worker_stop)
+    options = dict(options)
+    options["rng"] = task_rng
+    options["progress"] = progress
+    cache_size = options.pop("cache_size")
+    options["cache"] = EvaluationCache(cache_size) if cache_size else None
+    #Each start keeps its own stats; they travel back with the result and are merged by the caller.
+    trace_every = options.pop("trace_every")
+    options["stats"] = SearchStats(trace_every) if trace_every is not None else None
+    initial_sequence = rows_to_sequence(table, initial_rows)
+    if problem == "Flowshop" and method == "NEH Insertion":
+        result = local_search_flowshop_insertion(table, machines, 0, initial_sequence, iterations=iterations, objective=options["objective"],
+                                                 progress=progress, stats=options["stats"], rng=options["rng"])
+    elif problem == "Flowshop":
+        result = local_search_flowshop(table, rule, machines, 0, initial_sequence, method, iterations=iterations, initial_threshold=threshold, **options)
+    else:
+        result = local_search(table, rule, machines, 0, initial_sequence, method, iterations=iterations, initial_threshold=threshold, **options)
+    if options["cache"] is not None and options["stats"] is not None:
+        options["stats"].count_cache(options["cache"])
+    return (rule, initial_sequence) + result + (options["stats"],)
+
+def parallel_multistart_search(jobs, machines, method, problem="Parallel", threshold=0, restarts=0, workers=None, iterations=500, rng=None,
+                                cooling=None, time_limit=None, stagnation_limit=None, objective="Makespan", progress=None, cache_size=0, stats=None,
+                                neighborhood="Swap", strategy="Random"):
+    global _worker_table, _worker_stop
+    table = build_job_table(jobs)
+    if problem == "Flowshop" and method == "NEH Insertion":
+        starts = [("NEH", sequence_to_rows(table, neh_sequence(table, machines)))]
+    elif problem == "Flowshop":
+        starts = [(rule, dispatching_rows(table, rule)) for rule in ["SPT", "LPT", "EDD"]]
+    else:
+        starts = [(rule, dispatching_rows(table, rule)) for rule in feasible_rules(table, machines, ["SPT", "LPT", "Wrap-Around"])]
+
+    #Random restarts use list scheduling. Each task gets its own child of rng, so runs are repeatable whichever
+    #worker a task lands on and no two tasks share a stream; a restart splits its child once more, so the draw of
+    #its starting order and its search do not repeat each other's numbers.
+    streams = search_rng(rng).spawn(len(starts) + restarts)
+    for k in range(restarts):
+        order_rng, streams[len(starts)] = streams[len(starts)].spawn(2)
+        starts.append((f"Restart {k + 1}", order_rng.permutation(len(table.job_numbers))))
+    #Tasks carry the trace interval rather than the caller's stats, which may hold an unpicklable profiler.
+    options = {"cooling": cooling, "time_limit": time_limit, "stagnation_limit": stagnation_limit, "objective": objective,
+               "cache_size": cache_size, "trace_every": stats.trace_every if stats is not None else None,
+               "neighborhood": neighborhood, "strategy": strategy}
+    tasks = [(problem, rule, machines, method, rows, iterations, threshold, task_rng, options) for (rule, rows), task_rng in zip(starts, streams)]
+
+    if workers == 1:
+        #In-process starts run one after another and report progress as parts of the whole run.
+        _worker_table, _worker_stop = table, None
+        results = []
+        for k, task in enumerate(tasks):
+            results.append(_run_search_start(task, progress.part(k, len(tasks)) if progress is not None else None))
+            if progress is not None and progress.stopped():
+                break
+    else:
+        #The job table is sent once per worker through the initializer, not with every task, together with an event
+        #that stops the running searches on cancel. Progress counts finished tasks.
+        import multiprocessing
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        stop_event = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_search_worker, initargs=(table, stop_event)) as pool:
+            futures = [pool.submit(_run_search_start, task) for task in tasks]
+            pending = set(futures)
+            best = None
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    best = future.result()[3] if best is None else min(best, future.result()[3])
+                if progress is None:
+                    continue
+                progress.report(1 - len(pending) / len(futures), best)
+                if progress.stopped():
+                    #Queued starts are dropped; running ones see the event and return their best so far.
+                    stop_event.set()
+                    pool.shutdown(cancel_futures=True)
+                    break
+            results = [future.result() for future in futures if not future.cancelled()]
+
+    best_overall_makespan = float('inf')
+    sequences_rules = {}
+    num_neighborhood = 0
+    for rule, initial_sequence, best_sequence, best_makespan, best_schedule, neighbours, start_stats in results:
+        num_neighborhood += neighbours
+        if stats is not None:
+            stats.merge(start_stats)
+        if not rule.startswith("Restart"):
+            sequences_rules["Initial_sequence_" + rule] = initial_sequence
+        if best_makespan < best_overall_makespan:
+            best_overall_sequence = best_sequence
+            best_overall_makespan = best_makespan
+            best_overall_schedule = best_schedule
+    print(f"Number of neighborhood structures is {num_neighborhood}")
+    return best_overall_sequence, best_overall_schedule, sequences_rules
+
+
+#Population-based search: whole sets of sequences are scored with one batched array evaluation.
+POPULATION_METHODS = ["Genetic Algorithm", "Iterated Greedy"]
+
+def parallel_costs(table, candidates, machines, rule, weights):
+    #Objective of every row of candidates under list scheduling (or Wrap-Around), one NumPy step per position over
+    #all candidates; the same schedules as machine_schedule, ties going to the lowest machine number.
+    candidates = np.atleast_2d(candidates)
+    count, length = candidates.shape
+    times = table.process_time[candidates]
+    pool = machine_pool(table, machines)
+    if pool is not None and rule == "Wrap-Around":
+        if pool.restricted:
+            raise ValueError("Wrap-Around can not respect machine eligibility.")
+        times = pool.machine_times[candidates, np.arange(length) % machines]
+    elif pool is not None:
+        times = pool.machine_times
+    released = table.release_date.any()
+    time_type = np.result_type(times, table.release_date) if released else times.dtype
+    if rule == "Wrap-Around":
+        width = -(-length // machines) * machines
+        padded = np.zeros((count, width), dtype=time_type)
+        padded[:, :length] = times
+        padded = padded.reshape(count, -1, machines)
+        totals = np.cumsum(padded, axis=1)
+        if released:
+            arrivals = np.zeros((count, width), dtype=time_type)
+            arrivals[:, :length] = table.release_date[candidates]
+            totals += np.maximum(np.maximum.accumulate(arrivals.reshape(count, -1, machines) - (totals - padded), axis=1), 0)
+        completion = totals.reshape(count, -1)[:, :length]
+    elif pool is not None:
+        #Earliest completion over the eligible machines, ties to the earlier free machine and then the lower number.
+        loads = np.zeros((count, machines), dtype=time_type)
+        completion = np.empty((count, length), dtype=time_type)
+        arrivals = table.release_date[candidates] if released else None
+        index = np.arange(count)
+        for position in range(length):
+            job_rows = candidates[:, position]
+            ends = (loads if arrivals is None else np.maximum(loads, arrivals[:, position, None])) + times[job_rows]
+            ends = np.where(pool.eligible[job_rows], ends, np.inf)
+            machine = np.where(ends == ends.min(axis=1, keepdims=True), loads, np.inf).argmin(axis=1)
+            end = ends[index, machine].astype(time_type)
+            loads[index, machine] = end
+            completion[:, position] = end
+    else:
+        loads = np.zeros((count, machines), dtype=time_type)
+        completion = np.empty((count, length), dtype=time_type)
+        arrivals = table.release_date[candidates] if released else None
+        index = np.arange(count)
+        for position in range(length):
+            machine = loads.argmin(axis=1)
+            end = loads[index, machine]
+            if arrivals is not None:
+                end = np.maximum(end, arrivals[:, position])
+            end = end + times[:, position]
+            loads[index, machine] = end
+            completion[:, position] = end
+    makespans = completion.max(axis=1) if length else np.zeros(count, dtype=time_type)
+    if not weights[1:].any():
+        return makespans
+    return weights[0] * makespans + job_costs(completion, table.due_date[candidates], table.weight[candidates], weights).sum(axis=1)
+
+class PopulationEvaluator:
+    #Scores populations ((individuals x jobs) row arrays) and every insertion position of a job in one call each.
+    #Parallel and single machine sequences are decoded by list scheduling (earliest completion on unrelated machines).
+    def __init__(self, table, machines, problem, objective="Makespan"):
+        self.table = None
+        self.machines = machines
+        self.problem = problem
+        self.weights = objective_weights(objective)
+        self.reset(table)
+
+    def reset(self, table):
+        #Another instance of the same problem; the flowshop times are only recomputed when they changed.
+        previous, self.table = self.table, table
+        if previous is not None and previous.stage_times is table.stage_times and previous.process_time is table.process_time:
+            return
+        if self.problem == "Flowshop":
+            stage_times = flowshop_stage_times(table, self.machines)
+            self.cumulative_times = flowshop_cumulative_times(stage_times)
+            self.reverse_cumulative_times = flowshop_cumulative_times(stage_times[:, ::-1])
+            self.mean_time = stage_times.mean() if stage_times.size else 0
+        else:
+            self.mean_time = table.process_time.mean() if len(table.process_time) else 0
+
+    def costs(self, population):
+        if self.problem == "Flowshop":
+            return flowshop_costs(self.cumulative_times, population, self.table, self.weights)
+        return parallel_costs(self.table, population, self.machines, None, self.weights)
+
+    def insertion_costs(self, rows, job_row, chunk_elements=1 << 22):
+        if self.problem == "Flowshop" and not self.weights[1:].any():
+            return taillard_insertion_makespans(self.cumulative_times, self.reverse_cumulative_times, rows, job_row)
+        #Long sequences are scored a slice of positions at a time so the candidate block stays bounded.
+        step = max(1, chunk_elements // (len(rows) + 1))
+        return np.concatenate([self.costs(insertion_candidates(rows, job_row, np.arange(start, min(start + step, len(rows) + 1))))
+                               for start in range(0, len(rows) + 1, step)])
+
+    def temperature(self, factor):
+        #Ruiz and Stutzle's constant temperature, factor * (mean operation time) / 10, in the units of the objective.
+        unit = self.mean_time if self.weights[[0, 1, 2, 3, 6]].any() else 1
+        if self.weights[[3, 5, 6]].any():
+            unit *= self.table.weight.mean()
+        return factor * unit / 10
+
+def _search_budget(started, generation, iterations, time_limit, progress):
+    #Fraction of the iteration (or generation) and wall-clock budgets used, or None once one of them (or a cancel) ends the search.
+    used = 0.0
+    if iterations is not None:
+        used = generation / iterations
+    if time_limit is not None:
+        used = max(used, (time.perf_counter() - started) / time_limit)
+    if used >= 1.0 or (progress is not None and progress.stopped()):
+        return None
+    return used
+
+def iterated_greedy(evaluator, rows, cost, iterations=500, time_limit=None, destruction=4, temperature=0.4, progress=None, stats=None,
+                    label="Iterated Greedy", rng=None):
+    #Ruiz and Stutzle's iterated greedy: remove `destruction` random jobs, put each back at its best position
+    #(all positions scored in one batch) and accept a worse result with probability exp(-delta / T).
+    #Returns (best rows, best cost, evaluations).
+    temperature = evaluator.temperature(temperature)
+    rng = search_rng(rng)
+    best_rows, best_cost = rows, cost
+    current_rows, current_cost = rows, cost
+    evaluations = 0
+    trace = stats.trace(label) if stats is not None else None
+    started = time.perf_counter()
+    iteration = 0
+    while len(rows) > 1:
+        used = _search_budget(started, iteration, iterations, time_limit, progress)
+        if used is None:
+            break
+        if progress is not None:
+            progress.report(used, best_cost)
+        iteration += 1
+        removed = rng.choice(len(current_rows), min(destruction, len(current_rows) - 1), replace=False)
+        partial = np.delete(current_rows, removed)
+        with timed(stats, "evaluation"):
+            for job_row in current_rows[removed].tolist():
+                costs = evaluator.insertion_costs(partial, job_row)
+                position = int(np.argmin(costs))
+                partial = np.insert(partial, position, job_row)
+                evaluations += len(costs)
+        new_cost = costs[position].item()
+        if new_cost <= current_cost or (temperature > 0 and rng.random() < math.exp(-(new_cost - current_cost) / temperature)):
+            current_rows, current_cost = partial, new_cost
+        if new_cost < best_cost:
+            best_rows, best_cost = partial, new_cost
+        if trace is not None:
+            trace["evaluation"].append(evaluations)
+            trace["best"].append(best_cost)
+            trace["current"].append(current_cost)
+    if stats is not None:
+        stats.evaluations += evaluations
+    return best_rows, best_cost, evaluations
+
+def order_crossover(first, second, child, rng):
+    #OX: child keeps a random slice of the first parent and takes the other jobs in the order of the second.
+    length = len(first)
+    start, end = sorted(rng.integers(0, length + 1, 2).tolist())
+    kept = np.zeros(length, dtype=bool)
+    kept[first[start:end]] = True
+    rest = second[~kept[second]]
+    child[:start] = rest[:start]
+    child[start:end] = first[start:end]
+    child[end:] = rest[start:]
+
+def genetic_algorithm(evaluator, population, iterations=500, time_limit=None, crossover_rate=0.9, mutation_rate=0.2, neighborhood="Insertion",
+                      progress=None, stats=None, label="Genetic Algorithm", rng=None):
+    #Generational GA over permutations: binary tournaments, order crossover, one random move as mutation and
+    #(mu + lambda) survival of the best distinct sequences. Offspring are written into a preallocated array and
+    #scored as one batch per generation. Returns (best rows, best cost, evaluations).
+    rng = search_rng(rng)
+    moves = neighborhood_moves(neighborhood)
+    size, length = population.shape
+    with timed(stats, "evaluation"):
+        costs = np.asarray(evaluator.costs(population))
+    evaluations = size
+    offspring = np.empty_like(population)
+    mutable = moves.size(length) > 0
+    trace = stats.trace(label) if stats is not None else None
+    started = time.perf_counter()
+    generation = 0
+    while length > 1:
+        used = _search_budget(started, generation, iterations, time_limit, progress)
+        if used is None:
+            break
+        if progress is not None:
+            progress.report(used, costs.min().item())
+        generation += 1
+        contestants = rng.integers(0, size, (size, 2))
+        parents = np.where(costs[contestants[:, 0]] <= costs[contestants[:, 1]], contestants[:, 0], contestants[:, 1])
+        for k in range(size):
+            first, second = population[parents[k]], population[parents[k - 1]]
+            if rng.random() < crossover_rate:
+                order_crossover(first, second, offspring[k], rng)
+            else:
+                offspring[k] = first
+            if mutable and rng.random() < mutation_rate:
+                moves.apply(offspring[k], moves.random(length, rng))
+        with timed(stats, "evaluation"):
+            offspring_costs = np.asarray(evaluator.costs(offspring))
+        evaluations += size
+        pool = np.concatenate([population, offspring])
+        pool_costs = np.concatenate([costs, offspring_costs])
+        _, distinct = np.unique(pool, axis=0, return_index=True)
+        survivors = distinct[np.argsort(pool_costs[distinct], kind='stable')[:size]]
+        if len(survivors) < size:
+            #Too few distinct sequences: fill up with the best duplicates.
+            rest = np.setdiff1d(np.arange(len(pool)), survivors)
+            survivors = np.concatenate([survivors, rest[np.argsort(pool_costs[rest], kind='stable')[:size - len(survivors)]]])
+        population = pool[survivors]
+        costs = pool_costs[survivors]
+        if trace is not None:
+            trace["evaluation"].append(evaluations)
+            trace["best"].append(costs.min().item())
+            trace["current"].append(offspring_costs.mean().item())
+    if stats is not None:
+        stats.evaluations += evaluations
+    best = int(np.argmin(costs))
+    return population[best].copy(), costs[best].item(), evaluations
+
+def population_search(jobs, machines, method, problem="Parallel", iterations=500, time_limit=None, population_size=50, objective="Makespan",
+                      destruction=4, temperature=0.4, crossover_rate=0.9, mutation_rate=0.2, neighborhood="Insertion", progress=None, stats=None,
+                      rng=None):
+    #Genetic Algorithm or Iterated Greedy seeded with the dispatching rule sequences; iterations counts generations
+    #(or destruction rounds) and time_limit is a wall-clock budget in seconds.
+    if method not in POPULATION_METHODS:
+        raise ValueError(f"Unknown population method: {method}")
+    if population_size < 2:
+        raise ValueError("Population size must be at least 2.")
+    check_budget(iterations, time_limit, None)
+    table = build_job_table(jobs)
+    rng = search_rng(rng)
+    evaluator = PopulationEvaluator(table, machines, problem, objective)
+    rules = ["SPT", "LPT", "EDD", "WSPT"] if problem == "Flowshop" else ["SPT", "LPT", "EDD", "WSPT", "Wrap-Around"]
+    sequences_rules = {}
+    with timed(stats, "dispatching"):
+        seeds = [dispatching_rows(table, rule) for rule in rules]
+    for rule, rows in zip(rules, seeds):
+        sequences_rules["Initial_sequence_" + rule] = rows_to_sequence(table, rows)
+
+    if method == "Iterated Greedy":
+        with timed(stats, "evaluation"):
+            costs = evaluator.costs(np.array(seeds))
+        start = int(np.argmin(costs))
+        best_rows, best_cost, evaluations = iterated_greedy(evaluator, seeds[start], costs[start].item(), iterations, time_limit, destruction,
+                                                            temperature, progress, stats, rng=rng)
+        evaluations += len(seeds)
+    else:
+        #The rest of the first population is random permutations.
+        population = np.empty((population_size, len(table.job_numbers)), dtype=np.intp)
+        population[:min(len(seeds), population_size)] = seeds[:population_size]
+        for k in range(len(seeds), population_size):
+            population[k] = rng.permutation(len(table.job_numbers))
+        best_rows, best_cost, evaluations = genetic_algorithm(evaluator, population, iterations, time_limit, crossover_rate, mutation_rate,
+                                                              neighborhood, progress, stats, rng=rng)
+    print(f"Number of neighborhood structures is {evaluations}")
+    schedule = build_schedule(table, best_rows, machines, problem)
+    return rows_to_sequence(table, best_rows), schedule, sequences_rules
+
+class SolverSession:
+    #Warm-start rescheduling. The session keeps the current sequence of an instance between edits: add_job,
+    #remove_job and change_due_date repair it at once (the job goes to its best insertion position, all positions
+    #scored in one batch), update() applies the differences to a reloaded instance, and reoptimize() runs a short
+    #bounded descent from there. The evaluators, the search state and its evaluation cache live as long as the
+    #session; an edit that changes the cost of a sequence moves the cache to a new instance version (see
+    #EvaluationCache.invalidate), one that does not (a due date under an objective without due dates) keeps it.
+    def __init__(self, jobs, problem, machines, objective="Makespan", sequence=None, neighborhood="Insertion", cache_size=1 << 16, rng=None):
+        self.problem = problem
+        self.rng = search_rng(rng)
+        self.machines = 1 if problem == "Single" else machines
+        self.objective = objective
+        self.neighborhood = neighborhood
+        self.cache_size = cache_size
+        table = build_job_table(jobs)
+        self.evaluator = evaluator = PopulationEvaluator(table, self.machines, problem, objective)
+        self.cache = EvaluationCache(cache_size) if cache_size else None
+        self.state = None
+        if sequence is not None:
+            rows = sequence_to_rows(table, sequence)
+            if len(rows) != len(table.job_numbers) or len(np.unique(rows)) != len(rows):
+                raise ValueError("The sequence must list every job once.")
+        else:
+            #Without a solved sequence the session starts from the best dispatching rule.
+            rules = ["SPT", "LPT", "EDD", "WSPT"] if problem == "Flowshop" else ["SPT", "LPT", "EDD", "WSPT", "Wrap-Around"]
+            seeds = np.array([dispatching_rows(table, rule) for rule in rules])
+            rows = seeds[int(np.argmin(evaluator.costs(seeds)))]
+        self._load(table, rows, invalidate=False)
+
+    def _evaluator(self, table):
+        #Edits check the new instance before this, so a rejected edit leaves the session as it was.
+        self.evaluator.reset(table)
+        return self.evaluator
+
+    def _load(self, table, rows, invalidate=True):
+        rows = np.asarray(rows, dtype=np.intp)
+        self.table, self.rows = table, rows
+        self.cost = self.evaluator.costs(rows[None])[0].item()
+        if invalidate and self.cache is not None:
+            self.cache.invalidate()
+        #The search state follows at the next re-plan, once for any number of edits.
+        self.edited = True
+
+    def _row(self, job_number):
+        if job_number not in self.table.row_of:
+            raise ValueError(f"Job {job_number} is not in the schedule.")
+        return self.table.row_of[job_number]
+
+    def _columns(self, **changed):
+        columns = {name: getattr(self.table, name) for name in INSTANCE_FIELDS}
+        columns.update(changed)
+        return make_job_table(**columns)
+
+    @staticmethod
+    def _best_insertion(evaluator, rows, job_row):
+        costs = evaluator.insertion_costs(rows, job_row)
+        return np.insert(rows, int(np.argmin(costs)), job_row)
+
+    def add_job(self, job_number, process_time, due_date, weight=1, release_date=0, machine_times=None, eligible_machines=None):
+        #machine_times gives the new job's time on every machine when the instance has per-machine times (process_time
+        #may then be None, meaning their sum); eligible_machines lists the machines (from 1) it may use.
+        table = self.table
+        if job_number in table.row_of:
+            raise ValueError(f"Job {job_number} is already in the schedule.")
+        times = np.asarray(machine_times) if machine_times is not None else np.zeros(0, dtype=table.stage_times.dtype)
+        if len(times) != table.stage_times.shape[1]:
+            raise ValueError(f"Job {job_number} needs a process time for each of the {table.stage_times.shape[1]} machines.")
+        if process_time is None:
+            process_time = times.sum().item()
+        eligible = np.zeros((len(table.eligible) + 1, 0), dtype=bool)
+        if eligible_machines is not None or table.eligible.shape[1]:
+            eligible = table.eligible
+            listed = list(eligible_machines) if eligible_machines is not None else []
+            if any(machine < 1 for machine in listed):
+                raise ValueError("Machines are numbered from 1.")
+            width = max([eligible.shape[1]] + listed)
+            #As in machine_eligibility, jobs allowed on every listed machine may also use the new columns.
+            padded = np.empty((len(eligible) + 1, width), dtype=bool)
+            padded[:-1, :eligible.shape[1]] = eligible
+            padded[:-1, eligible.shape[1]:] = eligible.all(axis=1)[:, None]
+            padded[-1] = eligible_machines is None
+            padded[-1, np.array(listed, dtype=np.intp) - 1] = True
+            eligible = padded
+        table = self._columns(job_numbers=np.append(table.job_numbers, job_number), process_time=np.append(table.process_time, process_time),
+                              due_date=np.append(table.due_date, due_date), weight=np.append(table.weight, weight),
+                              release_date=np.append(table.release_date, release_date), stage_times=np.vstack([table.stage_times, times]),
+                              eligible=eligible)
+        evaluator = self._evaluator(table)
+        #Appending keeps every other job's row, so the current sequence stays valid.
+        self._load(table, self._best_insertion(evaluator, self.rows, len(self.table.job_numbers)))
+        return self.cost
+
+    def remove_job(self, job_number):
+        row = self._row(job_number)
+        if len(self.table.job_numbers) == 1:
+            raise ValueError("The schedule needs at least one job.")
+        table = make_job_table(*(np.delete(getattr(self.table, name), row, axis=0) for name in INSTANCE_FIELDS))
+        rows = self.rows[self.rows != row]
+        self._evaluator(table)
+        self._load(table, rows - (rows > row))
+        return self.cost
+
+    def change_due_date(self, job_number, due_date):
+        #The job is taken out and put back at its best position under the new due date; its old position is one
+        #of the candidates, so the repair never makes the schedule worse.
+        row = self._row(job_number)
+        due = self.table.due_date.astype(np.result_type(self.table.due_date, due_date))
+        due[row] = due_date
+        table = self._columns(due_date=due)
+        evaluator = self._evaluator(table)
+        #Sequences keep their cost under a new due date unless the objective looks at due dates.
+        self._load(table, self._best_insertion(evaluator, self.rows[self.rows != row], row), invalidate=evaluator.weights[[2, 4, 5, 6]].any())
+        return self.cost
+
+    def update(self, jobs):
+        #Brings the session to a reloaded instance, e.g. the same file after jobs arrived or finished: new jobs are
+        #inserted, jobs that are gone removed and changed due dates repaired, each as one edit; a job whose other
+        #data changed is taken out and put back. Returns the number of edits.
+        table = build_job_table(jobs)
+        if table.stage_times.shape[1] != self.table.stage_times.shape[1]:
+            raise ValueError(f"The instance has process times for {table.stage_times.shape[1]} machines, not {self.table.stage_times.shape[1]}.")
+
+        def allowed(eligible, row):
+            return None if not eligible.shape[1] or eligible[row].all() else (np.flatnonzero(eligible[row]) + 1).tolist()
+
+        def add(job):
+            row = table.row_of[job]
+            self.add_job(job, table.process_time[row].item(), table.due_date[row].item(), table.weight[row].item(),
+                         table.release_date[row].item(), table.stage_times[row].tolist() if table.stage_times.shape[1] else None,
+                         allowed(table.eligible, row))
+
+        edits = 0
+        for job in table.job_numbers.tolist():
+            if job not in self.table.row_of:
+                add(job)
+                edits += 1
+        for job in self.table.job_numbers.tolist():
+            if job not in table.row_of:
+                self.remove_job(job)
+                edits += 1
+        for job in table.job_numbers.tolist():
+            row, current = table.row_of[job], self.table.row_of[job]
+            if (table.process_time[row] != self.table.process_time[current] or table.weight[row] != self.table.weight[current]
+                    or table.release_date[row] != self.table.release_date[current]
+                    or not np.array_equal(table.stage_times[row], self.table.stage_times[current])
+                    or allowed(table.eligible, row) != allowed(self.table.eligible, current)):
+                if len(self.table.job_numbers) == 1:
+                    self._evaluator(table)
+                    self._load(table, [0])
+                else:
+                    self.remove_job(job)
+                    add(job)
+                edits += 1
+            elif table.due_date[row] != self.table.due_date[current]:
+                self.change_due_date(job, table.due_date[row].item())
+                edits += 1
+        return edits
+
+    def reoptimize(self, iterations=2000, time_limit=0.5, strategy="First Improvement", progress=None, stats=None):
+        #A short descent from the current sequence, bounded by evaluations and seconds. Returns the evaluations used.
+        with timed(stats, "evaluation"):
+            if self.state is None:
+                #Built on the first re-plan and then kept; edits reset it to the new instance.
+                if self.problem == "Flowshop":
+                    self.state = FlowshopSwapEvaluator(self.table, self.evaluator.cumulative_times, self.rows, self.objective, cache=self.cache,
+                                                       neighborhood=self.neighborhood, rng=self.rng)
+                else:
+                    self.state = ParallelSwapEvaluator(self.table, self.rows, self.machines, None, self.objective, cache=self.cache,
+                                                       neighborhood=self.neighborhood, rng=self.rng)
+            elif self.edited:
+                with_times = (self.evaluator.cumulative_times,) if self.problem == "Flowshop" else ()
+                self.state.reset(self.table, *with_times, self.rows)
+        self.edited = False
+        self.rows, self.cost, evaluations = descend(self.state, strategy, iterations, time_limit, progress, stats, label="Re-plan")
+        return evaluations
+
+    def sequence(self):
+        return rows_to_sequence(self.table, self.rows)
+
+    def schedule(self):
+        return build_schedule(self.table, self.rows, self.machines, self.problem)
+
+
+def solve_problem(jobs, problem, machines, rule, method, threshold=0, objective="Makespan", **search_options):
+    #One request from the GUI or the command line: returns the objective table (with the sequences),
+    #the chosen sequence, the label its Gantt chart is drawn with and its schedule.
+    table = build_job_table(jobs)
+    if threshold < 0:
+        raise ValueError("Threshold can not be negative.")
+    if method == "Exact":
+        if problem != "Single":
+            raise ValueError("The exact solvers are only available for Single.")
+        with timed(search_options.get("stats"), "search"):
+            rows, lower_bound, proven = exact_single_machine_rows(table, objective, search_options.get("time_limit"), search_options.get("progress"),
+                                                                  search_options.get("rng"))
+        schedule = build_schedule(table, rows, 1, problem)
+        results = schedule_objectives(table, schedule)
+        sequence = rows_to_sequence(table, rows)
+        results["Exact Sequence"] = sequence
+        results["Optimality"] = "Proven optimal" if proven else "Stopped early, best sequence found"
+        results[f"Lower bound ({objective})"] = results[objective] if proven else lower_bound
+        return results, sequence, method, schedule
+    if method == "None" or not method:
+        stats = search_options.get("stats")
+        with timed(stats, "dispatching"):
+            if problem == "Flowshop":
+                initial_sequence = apply_dispatching_rule_flowshop(table, rule)
+            elif table.release_date.any() and rule != "Wrap-Around" and machine_pool(table, machines) is None:
+                #Jobs arrive over time, so the rule chooses among the released jobs each time a machine frees up.
+                #Machines of different speeds are left to the earliest completion decoding of the static order.
+                initial_sequence = rows_to_sequence(table, online_dispatch_rows(table, machines, rule))
+            else:
+                initial_sequence = apply_dispatching_rule(table, rule)
+        with timed(stats, "evaluation"):
+            schedule = build_schedule(table, sequence_to_rows(table, initial_sequence), machines, problem, rule)
+        results = schedule_objectives(table, schedule)
+        results[rule+" Sequence"] = initial_sequence
+        return results, initial_sequence, rule, schedule
+
+    population_size = search_options.pop("population_size", 50)
+    restarts = search_options.pop("restarts", 0)
+    search_workers = search_options.pop("search_workers", 1)
+    if method in POPULATION_METHODS:
+        #The evaluation cache, the local search strategy and the annealing settings do not apply to the population methods.
+        options = {name: value for name, value in search_options.items()
+                   if name not in ("cache_size", "strategy", "cooling", "stagnation_limit")}
+        best_sequence,schedule,sequences_rules = population_search(table,machines,method,problem,population_size=population_size,objective=objective,**options)
+    elif restarts or search_workers != 1:
+        #Random restarts, or starts spread over worker processes (None: all cores).
+        best_sequence,schedule,sequences_rules = parallel_multistart_search(table,machines,method,problem,threshold=threshold,restarts=restarts,
+                                                                            workers=search_workers,objective=objective,**search_options)
+    elif problem == "Flowshop":
+        best_sequence,schedule,sequences_rules = find_best_solution_flowshop(table,machines,method,threshold=threshold,objective=objective,**search_options)
+    else:
+        best_sequence,schedule,sequences_rules = find_best_solution(table,machines,method,threshold=threshold,objective=objective,**search_options)
+    results = schedule_objectives(table, schedule)
+    results[method+" Sequence"] = best_sequence
+    results.update(sequences_rules)
+    return results, best_sequence, method, schedule
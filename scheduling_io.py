@@ -0,0 +1,115 @@
+import hashlib
+import os
+
+import numpy as np
+
+from scheduling_core import ELIGIBLE_COLUMN, INSTANCE_FIELDS, STAGE_COLUMN, eligibility_mask, make_job_table, stage_columns
+
+#Reading instance files (Excel, CSV or Parquet) into a JobTable. pandas is imported only when a file is parsed.
+
+REQUIRED_COLUMNS = ['Job Number', 'process time', 'due date', 'weight']
+
+def load_jobs_from_excel(file_path):
+    import pandas as pd
+    return pd.read_excel(file_path)
+
+#Parsed instances are cached as .npz files keyed by path, modification time and size.
+INSTANCE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "machine_scheduling")
+def long_to_wide(jobs):
+    import pandas as pd
+    if jobs.duplicated(['Job Number', 'machine']).any():
+        raise ValueError("Each job can have only one row per machine.")
+    order = pd.unique(jobs['Job Number'])
+    times = jobs.pivot(index='Job Number', columns='machine', values='process time').reindex(order)
+    if times.isna().to_numpy().any():
+        raise ValueError("Every job needs a process time on every machine.")
+    wide = jobs.drop(columns=['machine', 'process time']).drop_duplicates('Job Number').set_index('Job Number').reindex(order)
+    for k, machine in enumerate(times.columns, start=1):
+        wide[f'process time {k}'] = times[machine].to_numpy()
+    return wide.reset_index()
+
+def read_job_columns(file_path):
+    #Reads only the job columns (stripped of stray spaces), with numeric dtypes given up front where the format allows.
+    import pandas as pd
+    wanted = REQUIRED_COLUMNS + ['release date', 'machine', ELIGIBLE_COLUMN]
+    def is_job_column(name):
+        name = str(name).strip()
+        return name in wanted or STAGE_COLUMN.match(name) is not None
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.csv':
+        names = [name for name in pd.read_csv(file_path, nrows=0).columns if is_job_column(name)]
+        try:
+            jobs = pd.read_csv(file_path, usecols=names,
+                               dtype={name: 'float64' for name in names if name.strip() not in ('Job Number', 'machine', ELIGIBLE_COLUMN)})
+        except ValueError:
+            #Text in a numeric column; re-read untyped so the check below can name the column.
+            jobs = pd.read_csv(file_path, usecols=names)
+    elif extension == '.parquet':
+        try:
+            import pyarrow.parquet as pq
+            names = [name for name in pq.read_schema(file_path).names if is_job_column(name)]
+        except ImportError:
+            names = None
+        jobs = pd.read_parquet(file_path, columns=names)
+    else:
+        jobs = pd.read_excel(file_path, usecols=is_job_column)
+    jobs.columns = [str(name).strip() for name in jobs.columns]
+    if 'machine' in jobs.columns:
+        missing_columns = [col for col in ['Job Number', 'process time'] if col not in jobs.columns]
+        if missing_columns:
+            raise ValueError(f"File is missing the following columns: {', '.join(missing_columns)}")
+        jobs = long_to_wide(jobs)
+    stages = stage_columns(jobs.columns)
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in jobs.columns and not (col == 'process time' and stages)]
+    if missing_columns:
+        raise ValueError(f"File is missing the following columns: {', '.join(missing_columns)}")
+
+    def numeric(name):
+        try:
+            values = pd.to_numeric(jobs[name]).to_numpy(dtype=np.float64)
+        except (TypeError, ValueError):
+            raise ValueError(f"Column '{name}' must contain only numbers.")
+        if np.isnan(values).any():
+            raise ValueError(f"Column '{name}' has empty cells.")
+        if (values < 0).any():
+            raise ValueError(f"Column '{name}' can not be negative.")
+        #Whole numbers stay integers so objectives are shown without decimals.
+        return values.astype(np.int64) if np.array_equal(values, np.round(values)) else values
+
+    job_numbers = jobs['Job Number'].to_numpy()
+    if job_numbers.dtype == object:
+        job_numbers = job_numbers.astype(str)
+    elif np.issubdtype(job_numbers.dtype, np.floating) and np.array_equal(job_numbers, np.round(job_numbers)):
+        job_numbers = job_numbers.astype(np.int64)
+    release_date = numeric('release date') if 'release date' in jobs.columns else np.zeros(len(jobs), dtype=np.int64)
+    stage_times = np.column_stack([numeric(name) for name in stages]) if stages else np.zeros((len(jobs), 0), dtype=np.int64)
+    #Without a 'process time' column a job's total work stands in for it in the dispatching rules.
+    process_time = numeric('process time') if 'process time' in jobs.columns else stage_times.sum(axis=1)
+    eligible = eligibility_mask(jobs[ELIGIBLE_COLUMN].tolist()) if ELIGIBLE_COLUMN in jobs.columns else np.zeros((len(jobs), 0), dtype=bool)
+    return [job_numbers, process_time, numeric('due date'), numeric('weight'), release_date, stage_times, eligible]
+
+def instance_cache_path(file_path, cache_dir=INSTANCE_CACHE_DIR):
+    status = os.stat(file_path)
+    key = f"{os.path.abspath(file_path)}|{status.st_mtime_ns}|{status.st_size}"
+    return os.path.join(cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".npz")
+
+def load_job_table(file_path, cache_dir=INSTANCE_CACHE_DIR):
+    cache_path = instance_cache_path(file_path, cache_dir) if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                return make_job_table(*(cached[field] for field in INSTANCE_FIELDS))
+        except (OSError, ValueError, KeyError):
+            pass
+    columns = read_job_columns(file_path)
+    table = make_job_table(*columns)
+    if cache_path:
+        #A missing or read-only cache directory only costs the next load a re-parse.
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            partial_path = cache_path + f".{os.getpid()}.tmp.npz"
+            np.savez(partial_path, **dict(zip(INSTANCE_FIELDS, columns)))
+            os.replace(partial_path, cache_path)
+        except OSError:
+            pass
+    return table
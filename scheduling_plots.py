@@ -0,0 +1,102 @@
+import numpy as np
+
+from scheduling_core import build_job_table, build_schedule, sequence_to_rows
+
+#Gantt and convergence charts. matplotlib is imported only when a chart is drawn; with an output path the figure is
+#built on an Agg canvas, so charts can be saved without pyplot or a display.
+
+def gantt_figure(table, schedule, machines, title, ylabel=None, headless=False):
+    #One broken_barh collection per machine instead of a bar and a text artist per operation.
+    #headless builds the figure on an Agg canvas so it can be saved without pyplot or a display.
+    from matplotlib.colors import to_rgba_array
+    if headless:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)
+    else:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=(10, 6))
+    ax = fig.add_subplot()
+    machine_index, start, end = schedule['machine'], schedule['start'], schedule['end']
+    labels = [f"Job {job}" for job in table.job_numbers[schedule['row']].tolist()]
+    palette = to_rgba_array([f"C{i}" for i in range(10)])
+    colours = palette[schedule['row'] % 10]
+    duration = end - start
+    for machine in range(machines):
+        on_machine = machine_index == machine
+        ax.broken_barh(np.column_stack((start[on_machine], duration[on_machine])), (machine - 0.4, 0.8),
+                       facecolors=colours[on_machine], edgecolor='black', linewidth=0.5)
+    ax.set_yticks(range(machines), [f"Machine {machine + 1}" for machine in range(machines)])
+    ax.invert_yaxis()
+    ax.set_xlabel("Time")
+    if ylabel:
+        ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    fig.tight_layout()
+
+    #Labels are redrawn for the visible bars that are wide enough at the current zoom.
+    label_pixels = np.array([len(label) for label in labels]) * 7 * fig.dpi / 100
+    texts = []
+    def draw_labels(*_):
+        for text in texts:
+            text.remove()
+        texts.clear()
+        left, right = ax.get_xlim()
+        pixels_per_unit = ax.bbox.width / max(right - left, 1e-9)
+        visible = (end > left) & (start < right) & (duration * pixels_per_unit >= label_pixels)
+        for i in np.flatnonzero(visible)[:2000].tolist():
+            texts.append(ax.text((start[i] + end[i]) / 2, machine_index[i], labels[i], ha='center', va='center', color='white', clip_on=True))
+    ax.callbacks.connect('xlim_changed', draw_labels)
+    fig.canvas.mpl_connect('resize_event', draw_labels)
+    ax.set_xlim(0, max(end.max(initial=0), 1) * 1.02)
+    return fig
+
+def show_or_save(fig, output_path):
+    if output_path:
+        fig.savefig(output_path)
+    else:
+        import matplotlib.pyplot as plt
+        plt.show()
+
+def schedule_gantt_chart(jobs, schedule, machines, problem, label, output_path=None):
+    #Draws a schedule that has already been built, so the chart is exactly the schedule that was evaluated.
+    table = build_job_table(jobs)
+    if problem == "Flowshop":
+        fig = gantt_figure(table, schedule, machines, "Gantt Chart for Flow Shop Scheduling for " + label, ylabel="Machines",
+                           headless=output_path is not None)
+    else:
+        fig = gantt_figure(table, schedule, machines, f"Gantt Chart ({label} Rule)", headless=output_path is not None)
+    show_or_save(fig, output_path)
+
+def generate_gantt_chart(machines, jobs, sequence, rule, output_path=None):
+    table = build_job_table(jobs)
+    schedule = build_schedule(table, sequence_to_rows(table, sequence), machines, rule=rule)
+    schedule_gantt_chart(table, schedule, machines, "Parallel", rule, output_path)
+
+def generate_gantt_chart_flowshop(machines, jobs, sequence,method, output_path=None):
+    table = build_job_table(jobs)
+    schedule = build_schedule(table, sequence_to_rows(table, sequence), machines, "Flowshop")
+    schedule_gantt_chart(table, schedule, machines, "Flowshop", method, output_path)
+
+def plot_convergence(stats, output_path=None):
+    #Best objective per start of a SearchStats run, with the current objective drawn faintly behind it.
+    if output_path:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)
+    else:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=(10, 6))
+    ax = fig.add_subplot()
+    for k, (start, trace) in enumerate(stats.traces.items()):
+        ax.plot(trace["evaluation"], trace["current"], color=f"C{k % 10}", alpha=0.25, linewidth=0.8)
+        ax.plot(trace["evaluation"], trace["best"], color=f"C{k % 10}", label=start)
+    ax.set_xlabel("Evaluation")
+    ax.set_ylabel("Objective")
+    ax.set_title("Convergence")
+    if stats.traces:
+        ax.legend()
+    fig.tight_layout()
+    show_or_save(fig, output_path)